@@ -1,57 +1,85 @@
 import sys
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
-# Add lib directory to Python path
+# Add lib directory to Python path, for running the blender on its own. Imported from
+# pdf_manager, Pillow is already loaded; changing sys.path then would only reach the
+# combine workers it spawns, which inherit it and would pick up the vendored build.
 script_dir = os.path.dirname(os.path.abspath(__file__))
 lib_dir = os.path.join(script_dir, 'lib')
-if lib_dir not in sys.path:
+if 'PIL' not in sys.modules and lib_dir not in sys.path:
     sys.path.insert(0, lib_dir)
 
 from PySide6.QtWidgets import (
     QApplication, QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
-    QPushButton, QComboBox, QFileDialog, QMessageBox, QScrollArea, QWidget
+    QPushButton, QComboBox, QFileDialog, QMessageBox, QScrollArea, QWidget, QCheckBox
 )
 from PySide6.QtGui import QPixmap, QImage, QPainter
-from PySide6.QtCore import Qt, QSize
-import fitz  # PyMuPDF
-from PIL import Image, ImageChops, ImageEnhance, ImageOps
+from PySide6.QtCore import Qt, QSize, QRect, QPoint, QObject, QRunnable, QThreadPool, Signal, Slot
+import numpy as np
+from PIL import Image
+
+from blend_ops import BLEND_OPS, run_blend, to_device
 
 # Define a fixed preview size
 PREVIEW_WIDTH = 200
 PREVIEW_HEIGHT = 200
+# Below this many pixels Pillow's own alpha_composite beats the NumPy setup cost
+SMALL_BLEND_PIXELS = 64 * 64
+
+class ImageLoader(QObject, QRunnable):
+    """Loads one blender layer on a QThreadPool thread."""
+    finished = Signal(int, object, str) # layer, PIL image or None, error message
+
+    def __init__(self, load_fn, file_path, layer):
+        QObject.__init__(self)
+        QRunnable.__init__(self)
+        self.setAutoDelete(False) # Lifetime is owned by the dialog
+        self.load_fn = load_fn
+        self.file_path = file_path
+        self.layer = layer
+
+    def run(self):
+        try:
+            self.finished.emit(self.layer, self.load_fn(self.file_path), "")
+        except Exception as e:
+            self.finished.emit(self.layer, None, f"Could not load or convert image '{os.path.basename(self.file_path)}': {e}")
+
 
 def convert_pil_to_qimage(pil_img):
     """Convert PIL Image to QImage."""
-    if pil_img.mode == "RGB":
-        r, g, b = pil_img.split()
-        pil_img = Image.merge("RGB", (b, g, r))
-    elif pil_img.mode == "RGBA":
-        r, g, b, a = pil_img.split()
-        pil_img = Image.merge("RGBA", (b, g, r, a))
-
+    # Format_RGB888/Format_RGBA8888 take PIL's byte order as-is, no channel swap needed
     if pil_img.mode == "L": # Grayscale
         # Qt expects 8-bit grayscale
         # Pillow 'L' mode is 8-bit, QImage.Format_Grayscale8
         data = pil_img.tobytes("raw", "L")
-        qimage = QImage(data, pil_img.width, pil_img.height, QImage.Format_Grayscale8)
+        qimage = QImage(data, pil_img.width, pil_img.height, pil_img.width, QImage.Format_Grayscale8)
+        qimage._buf = data # QImage does not copy the buffer
         return qimage
 
-    # For RGB/RGBA
-    data = pil_img.tobytes("raw", pil_img.mode)
-    if pil_img.mode == "RGB":
-        qimage = QImage(data, pil_img.width, pil_img.height, QImage.Format_RGB888)
-    elif pil_img.mode == "RGBA":
-        qimage = QImage(data, pil_img.width, pil_img.height, QImage.Format_RGBA8888)
-    else: # Fallback for other modes, might not display correctly
+    if pil_img.mode not in ("RGB", "RGBA"): # Fallback for other modes
         pil_img = pil_img.convert("RGBA")
-        r, g, b, a = pil_img.split()
-        pil_img = Image.merge("RGBA", (b, g, r, a))
-        data = pil_img.tobytes("raw", "RGBA")
-        qimage = QImage(data, pil_img.width, pil_img.height, QImage.Format_RGBA8888)
+
+    if pil_img.mode == "RGB":
+        data = pil_img.tobytes("raw", "RGB")
+        qimage = QImage(data, pil_img.width, pil_img.height, 3 * pil_img.width, QImage.Format_RGB888)
+    else:
+        # Premultiply once here (Blinn's INT_MULT) so Qt skips its own pass at draw time
+        data = np.array(pil_img, dtype=np.uint8)
+        alpha = data[:, :, 3:4].astype(np.uint32)
+        t = data[:, :, :3] * alpha + 128
+        data[:, :, :3] = (t + (t >> 8)) >> 8
+        qimage = QImage(data.data, pil_img.width, pil_img.height, 4 * pil_img.width, QImage.Format_RGBA8888_Premultiplied)
+    qimage._buf = data # QImage does not copy the buffer
     return qimage
 
 
 class ImageBlenderWindow(QDialog):
+    blendFinished = Signal(object, str, bool, str) # blended image, mode, preview, error message
+    saveFinished = Signal(str, str) # saved path, error message
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Image Blender")
@@ -61,7 +89,24 @@ class ImageBlenderWindow(QDialog):
         self.image_path2 = None
         self.pil_image1 = None
         self.pil_image2 = None
+        self.pil_image1_arr = None # Read-only RGBA uint8 views, rebuilt only when a layer is reloaded
+        self.pil_image2_arr = None
+        self.pil_image1_dev = None
+        self.pil_image2_dev = None
         self.blended_image = None
+        self._blended_mode = None
+        self._blended_is_preview = False
+        self._result_qimage = None # Reused paint target for the result label
+        self._preview_cache = {} # id(pil_image) -> scaled QPixmap
+        self._pdf_cache = {} # (path, mtime) -> open fitz.Document
+        self._pdf_lock = threading.Lock()
+        self._image_loaders = set() # Keeps in-flight ImageLoader runnables alive
+        # Its own pool, so closing the dialog waits on its loaders and not on the main window's jobs
+        self._loader_pool = QThreadPool(self)
+        self._blend_executor = ThreadPoolExecutor(max_workers=1)
+        self._blend_out = {} # shape -> preallocated uint8 output buffer, reused across mode switches
+        self.blendFinished.connect(self._on_blend_finished)
+        self.saveFinished.connect(self._on_save_finished)
 
         main_layout = QVBoxLayout(self)
 
@@ -113,6 +158,10 @@ class ImageBlenderWindow(QDialog):
             "Lighten", "Add", "Subtract", "Difference"
         ])
         blend_options_layout.addWidget(self.blend_mode_combo)
+        self.preview_quality_checkbox = QCheckBox("Preview quality")
+        self.preview_quality_checkbox.setToolTip("Blend at preview resolution; saving re-blends at full resolution.")
+        self.preview_quality_checkbox.setChecked(True)
+        blend_options_layout.addWidget(self.preview_quality_checkbox)
         self.blend_button = QPushButton("Blend Images")
         self.blend_button.clicked.connect(self._blend_images)
         blend_options_layout.addWidget(self.blend_button)
@@ -141,156 +190,214 @@ class ImageBlenderWindow(QDialog):
         if file_path:
             self.image_path1 = file_path
             self.file1_edit.setText(file_path)
-            self.pil_image1 = self._load_and_convert_image(file_path)
-            if self.pil_image1:
-                self._update_preview(self.preview1_label, self.pil_image1)
+            self._start_image_load(file_path, 1)
 
     def _browse_file2(self):
         file_path, _ = QFileDialog.getOpenFileName(self, "Select Layer 2 Image", "", "Images (*.png *.jpg *.jpeg *.bmp *.pdf)")
         if file_path:
             self.image_path2 = file_path
             self.file2_edit.setText(file_path)
-            self.pil_image2 = self._load_and_convert_image(file_path)
-            if self.pil_image2:
-                self._update_preview(self.preview2_label, self.pil_image2)
+            self._start_image_load(file_path, 2)
+
+    def _start_image_load(self, file_path, layer):
+        browse_btn, preview_label = self._layer_widgets(layer)
+        browse_btn.setEnabled(False)
+        preview_label.setText("Loading...")
+        loader = ImageLoader(self._load_and_convert_image, file_path, layer)
+        loader.finished.connect(self._on_image_loaded)
+        self._image_loaders.add(loader)
+        self._loader_pool.start(loader)
+
+    @Slot(int, object, str)
+    def _on_image_loaded(self, layer, img, error):
+        self._image_loaders.discard(self.sender())
+        browse_btn, preview_label = self._layer_widgets(layer)
+        browse_btn.setEnabled(True)
+        if error:
+            preview_label.setText(f"Preview Layer {layer}")
+            QMessageBox.warning(self, "Load Error", error)
+            return
+        old_img = getattr(self, f"pil_image{layer}")
+        if old_img is not None:
+            self._preview_cache.pop(id(old_img), None)
+        setattr(self, f"pil_image{layer}", img)
+        arr = np.ascontiguousarray(img, dtype=np.uint8)
+        arr.setflags(write=False)
+        setattr(self, f"pil_image{layer}_arr", arr)
+        setattr(self, f"pil_image{layer}_dev", to_device(arr)) # GPU copy, if CuPy is available and the layer is large
+        self._blend_out.clear() # Sized for the old layers
+        self._update_preview(preview_label, img)
+
+    def _layer_widgets(self, layer):
+        if layer == 1:
+            return self.file1_browse_btn, self.preview1_label
+        return self.file2_browse_btn, self.preview2_label
 
     def _load_and_convert_image(self, file_path):
-        try:
-            if file_path.lower().endswith(".pdf"):
-                img = self._convert_pdf_to_pil_png(file_path)
-            else:
-                img = Image.open(file_path)
-            
-            if img.mode != 'RGBA': # Ensure RGBA for blending
-                img = img.convert('RGBA')
-            return img
-        except Exception as e:
-            QMessageBox.warning(self, "Load Error", f"Could not load or convert image '{os.path.basename(file_path)}': {e}")
-            return None
+        """Load a layer as RGBA. Runs on a worker thread, so errors are raised, not shown."""
+        if file_path.lower().endswith(".pdf"):
+            img = self._convert_pdf_to_pil_png(file_path)
+        else:
+            img = Image.open(file_path)
+            img.load() # Decode here rather than lazily on the GUI thread
+
+        if img.mode != 'RGBA': # Ensure RGBA for blending
+            img = img.convert('RGBA')
+        return img
 
     def _convert_pdf_to_pil_png(self, pdf_path, page_num=0):
-        try:
-            doc = fitz.open(pdf_path)
+        """Rasterize a PDF page at native resolution to an RGBA PIL image."""
+        import fitz  # PyMuPDF; imported here so opening the dialog doesn't load MuPDF
+
+        key = (pdf_path, os.path.getmtime(pdf_path)) # A file edited since it was opened gets reparsed
+        with self._pdf_lock: # fitz documents are not safe to share across threads
+            doc = self._pdf_cache.get(key)
+            if doc is None:
+                for stale in [k for k in self._pdf_cache if k[0] == pdf_path]:
+                    self._pdf_cache.pop(stale).close()
+                doc = fitz.open(pdf_path)
+                self._pdf_cache[key] = doc
             if not doc.page_count > page_num:
                 raise ValueError(f"Page number {page_num} out of range for PDF with {doc.page_count} pages.")
-            page = doc.load_page(page_num)
-            pix = page.get_pixmap(alpha=True) # Get pixmap with alpha
-            doc.close()
-            if pix.alpha:
-                img = Image.frombytes("RGBA", [pix.width, pix.height], pix.samples)
-            else: # If no alpha channel in PDF source, samples are RGB
-                img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples).convert("RGBA")
-            return img
-        except Exception as e:
-            QMessageBox.warning(self, "PDF Conversion Error", f"Could not convert PDF '{os.path.basename(pdf_path)}' to PNG: {e}")
-            return None
+            pix = doc.load_page(page_num).get_pixmap(alpha=True) # Get pixmap with alpha
+        if pix.alpha:
+            img = Image.frombuffer("RGBA", (pix.width, pix.height), pix.samples_mv, "raw", "RGBA", pix.stride, 1).copy()
+        else: # If no alpha channel in PDF source, samples are RGB
+            img = Image.frombuffer("RGB", (pix.width, pix.height), pix.samples_mv, "raw", "RGB", pix.stride, 1).convert("RGBA")
+        return img
 
     def _update_preview(self, preview_label_widget, pil_image):
         if pil_image:
-            qimage = convert_pil_to_qimage(pil_image.copy())
+            key = id(pil_image)
+            if key in self._preview_cache:
+                preview_label_widget.setPixmap(self._preview_cache[key])
+                return
+            # Downscale first so only preview-sized bytes go through Qt; resize() already
+            # returns a new image, and convert_pil_to_qimage keeps its own buffer alive
+            ratio = min(PREVIEW_WIDTH / pil_image.width, PREVIEW_HEIGHT / pil_image.height, 1.0)
+            thumb = pil_image
+            if ratio < 1.0:
+                size = (max(1, round(pil_image.width * ratio)), max(1, round(pil_image.height * ratio)))
+                thumb = pil_image.resize(size, Image.Resampling.BICUBIC, reducing_gap=2.0)
+            qimage = convert_pil_to_qimage(thumb)
             pixmap = QPixmap.fromImage(qimage)
             scaled_pixmap = pixmap.scaled(PREVIEW_WIDTH, PREVIEW_HEIGHT, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+            self._preview_cache[key] = scaled_pixmap
             preview_label_widget.setPixmap(scaled_pixmap)
         else:
             preview_label_widget.setText("Preview N/A")
 
-    def _blend_images(self):
-        if not self.pil_image1 or not self.pil_image2:
-            QMessageBox.warning(self, "Error", "Please select two images first.")
-            return
+    def _compute_blend(self, blend_mode, preview=False):
+        """Blend the two loaded layers and return an RGBA PIL image.
+
+        With preview=True both layers are first scaled down so the longest side
+        is at most 4 * PREVIEW_WIDTH; the full-resolution arrays are untouched.
+        """
+        img1, img2 = self.pil_image1, self.pil_image2
+        arr1, arr2 = self.pil_image1_arr, self.pil_image2_arr
 
-        img1 = self.pil_image1.copy()
-        img2 = self.pil_image2.copy()
+        if preview:
+            scale = min(1.0, 4 * PREVIEW_WIDTH / max(img1.width, img1.height))
+            if scale < 1.0:
+                size = (max(1, round(img1.width * scale)), max(1, round(img1.height * scale)))
+                img1 = img1.resize(size, Image.Resampling.BILINEAR)
+                img2 = img2.resize(size, Image.Resampling.BILINEAR)
+                arr1 = np.asarray(img1, dtype=np.uint8)
+                arr2 = np.asarray(img2, dtype=np.uint8)
 
         # Ensure images are the same size for most blend modes
         # Resize img2 to match img1's dimensions
-        if img1.size != img2.size:
-            img2 = img2.resize(img1.size, Image.Resampling.LANCZOS)
+        if abs(img1.width - img2.width) > 1 or abs(img1.height - img2.height) > 1:
+            # Only the exported full-resolution result pays for LANCZOS
+            resample = Image.Resampling.BILINEAR if preview else Image.Resampling.LANCZOS
+            img2 = img2.resize(img1.size, resample)
+            arr2 = np.asarray(img2, dtype=np.uint8)
+        elif img1.size != img2.size:
+            # PDFs can rasterize a pixel off; trim, or repeat the last row/column, instead of
+            # resampling. A transparent pad would leave a dark edge in Multiply, Darken, etc.
+            arr2 = np.asarray(img2, dtype=np.uint8)[:img1.height, :img1.width]
+            arr2 = np.pad(arr2, ((0, img1.height - arr2.shape[0]), (0, img1.width - arr2.shape[1]), (0, 0)), mode='edge')
+            img2 = Image.fromarray(arr2, 'RGBA')
+
+        if blend_mode == "Normal" and img1.width * img1.height < SMALL_BLEND_PIXELS:
+            # Alpha compositing: img2 on top of img1; tiny images aren't worth vectorizing
+            return Image.alpha_composite(img1, img2)
+        # Pillow doesn't have a direct ImageChops.overlay, so all modes run as NumPy kernels
+        out = self._blend_out.get(arr1.shape)
+        if out is None:
+            out = self._blend_out[arr1.shape] = np.empty(arr1.shape, dtype=np.uint8)
+        # Cached GPU copies are only valid while the layers weren't resized above
+        dev1 = self.pil_image1_dev if arr1 is self.pil_image1_arr else None
+        dev2 = self.pil_image2_dev if arr2 is self.pil_image2_arr else None
+        # The result shares the buffer, which is fine since each blend replaces blended_image
+        return Image.fromarray(run_blend(blend_mode, arr1, arr2, out, dev1, dev2), 'RGBA')
 
-        # Ensure RGBA mode for consistency
-        if img1.mode != 'RGBA': img1 = img1.convert('RGBA')
-        if img2.mode != 'RGBA': img2 = img2.convert('RGBA')
+    def _blend_images(self):
+        if not self.pil_image1 or not self.pil_image2:
+            QMessageBox.warning(self, "Error", "Please select two images first.")
+            return
 
         blend_mode = self.blend_mode_combo.currentText()
-        
-        try:
-            if blend_mode == "Normal":
-                # Alpha compositing: img2 on top of img1
-                self.blended_image = Image.alpha_composite(img1, img2)
-            elif blend_mode == "Add":
-                self.blended_image = ImageChops.add(img1, img2)
-            elif blend_mode == "Subtract":
-                self.blended_image = ImageChops.subtract(img1, img2)
-            elif blend_mode == "Multiply":
-                self.blended_image = ImageChops.multiply(img1, img2)
-            elif blend_mode == "Screen":
-                self.blended_image = ImageChops.screen(img1, img2)
-            elif blend_mode == "Lighten":
-                self.blended_image = ImageChops.lighter(img1, img2)
-            elif blend_mode == "Darken":
-                self.blended_image = ImageChops.darker(img1, img2)
-            elif blend_mode == "Difference":
-                self.blended_image = ImageChops.difference(img1, img2)
-            elif blend_mode == "Overlay":
-                # Pillow doesn't have a direct ImageChops.overlay.
-                # This is a common formula for overlay.
-                # It requires pixel-level access or more complex ImageChops combinations.
-                # For simplicity, we'll use a simplified version or one that might be available.
-                # A true overlay is (if base < 0.5: 2*base*blend else: 1 - 2*(1-base)*(1-blend))
-                # Let's try a simplified approach or skip if too complex for now.
-                # Using Image.blend with a mask or alpha might be an approximation.
-                # For now, let's implement a basic overlay logic.
-                # This is a common way to implement overlay:
-                base = img1.convert('RGB') # Overlay usually defined for RGB
-                blend = img2.convert('RGB')
-                
-                # Create an empty image for the result
-                overlay_img = Image.new('RGB', base.size)
-                
-                base_pixels = base.load()
-                blend_pixels = blend.load()
-                overlay_pixels = overlay_img.load()
-
-                for y in range(base.height):
-                    for x in range(base.width):
-                        r_base, g_base, b_base = base_pixels[x, y]
-                        r_blend, g_blend, b_blend = blend_pixels[x, y]
-
-                        def overlay_channel(b_ch, l_ch):
-                            b_ch /= 255.0
-                            l_ch /= 255.0
-                            if b_ch < 0.5:
-                                return int((2 * b_ch * l_ch) * 255.0)
-                            else:
-                                return int((1 - 2 * (1 - b_ch) * (1 - l_ch)) * 255.0)
-
-                        r_overlay = overlay_channel(r_base, r_blend)
-                        g_overlay = overlay_channel(g_base, g_blend)
-                        b_overlay = overlay_channel(b_base, b_blend)
-                        
-                        overlay_pixels[x, y] = (r_overlay, g_overlay, b_overlay)
-                self.blended_image = overlay_img.convert('RGBA') # Convert back to RGBA
-            else:
-                QMessageBox.warning(self, "Blend Error", f"Blend mode '{blend_mode}' not implemented yet.")
-                return
-
-            if self.blended_image:
-                q_blended_img = convert_pil_to_qimage(self.blended_image.copy())
-                pixmap = QPixmap.fromImage(q_blended_img)
-                # Scale to fit the label while maintaining aspect ratio
-                scaled_pixmap = pixmap.scaled(self.result_preview_label.size(), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                self.result_preview_label.setPixmap(scaled_pixmap)
-                self.save_button.setEnabled(True)
-            else:
-                self.result_preview_label.setText("Blending failed.")
-                self.save_button.setEnabled(False)
+        if blend_mode not in BLEND_OPS:
+            QMessageBox.warning(self, "Blend Error", f"Blend mode '{blend_mode}' not implemented yet.")
+            return
 
-        except Exception as e:
-            QMessageBox.critical(self, "Blending Error", f"An error occurred during blending: {e}")
+        preview = self.preview_quality_checkbox.isChecked()
+        self.blend_button.setEnabled(False)
+        self.save_button.setEnabled(False)
+        self.result_preview_label.setText("Blending...")
+        # The kernels are NumPy/Numba/C loops that release the GIL, so the UI keeps running
+        future = self._blend_executor.submit(self._compute_blend, blend_mode, preview)
+        future.add_done_callback(partial(self._emit_blend_finished, blend_mode, preview))
+
+    def _emit_blend_finished(self, blend_mode, preview, future):
+        # Runs on the executor thread; the queued signal hands the result to the GUI thread
+        error = future.exception()
+        self.blendFinished.emit(None if error else future.result(), blend_mode, preview, str(error) if error else "")
+
+    @Slot(object, str, bool, str)
+    def _on_blend_finished(self, blended_image, blend_mode, preview, error):
+        self.blend_button.setEnabled(True)
+        if error:
+            QMessageBox.critical(self, "Blending Error", f"An error occurred during blending: {error}")
             self.blended_image = None
             self.result_preview_label.setText("Blending Error.")
             self.save_button.setEnabled(False)
+            return
+
+        self.blended_image = blended_image
+        # Remember how the result was made so Save can redo it at full resolution
+        self._blended_mode = blend_mode
+        self._blended_is_preview = preview
+
+        if self.blended_image:
+            self._show_result(convert_pil_to_qimage(self.blended_image))
+            self.save_button.setEnabled(True)
+        else:
+            self.result_preview_label.setText("Blending failed.")
+            self.save_button.setEnabled(False)
 
+    def _show_result(self, q_blended_img):
+        """Paint the blend into a persistent label-sized buffer instead of building a new scaled pixmap."""
+        target = self.result_preview_label.size()
+        if self._result_qimage is None or self._result_qimage.size() != target:
+            self._result_qimage = QImage(target, QImage.Format_RGBA8888_Premultiplied)
+        self._result_qimage.fill(0)
+        # Scale to fit the label while maintaining aspect ratio
+        fitted = q_blended_img.size().scaled(target, Qt.AspectRatioMode.KeepAspectRatio)
+        dest_rect = QRect(QPoint((target.width() - fitted.width()) // 2, (target.height() - fitted.height()) // 2), fitted)
+        painter = QPainter(self._result_qimage)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        painter.drawImage(dest_rect, q_blended_img, q_blended_img.rect())
+        painter.end()
+        self.result_preview_label.setPixmap(QPixmap.fromImage(self._result_qimage))
+
+    def closeEvent(self, event):
+        self._loader_pool.waitForDone()
+        for doc in self._pdf_cache.values():
+            doc.close()
+        self._pdf_cache.clear()
+        super().closeEvent(event)
 
     def _save_result(self):
         if not self.blended_image:
@@ -299,16 +406,35 @@ class ImageBlenderWindow(QDialog):
 
         file_path, _ = QFileDialog.getSaveFileName(self, "Save Blended Image", "", "PNG Image (*.png);;JPEG Image (*.jpg *.jpeg)")
         if file_path:
-            try:
-                # Ensure the image is in a savable mode (e.g., RGB for JPEG)
-                save_image = self.blended_image
-                if file_path.lower().endswith((".jpg", ".jpeg")) and save_image.mode == 'RGBA':
-                    save_image = save_image.convert('RGB') # JPEG doesn't support alpha
-                
-                save_image.save(file_path)
-                QMessageBox.information(self, "Saved", f"Blended image saved to {file_path}")
-            except Exception as e:
-                QMessageBox.critical(self, "Save Error", f"Could not save image: {e}")
+            self.blend_button.setEnabled(False)
+            self.save_button.setEnabled(False)
+            # A full-resolution re-blend and encode can take seconds; run both on the blend thread
+            future = self._blend_executor.submit(
+                self._export_blend, file_path, self.blended_image,
+                self._blended_mode if self._blended_is_preview else None)
+            future.add_done_callback(partial(self._emit_save_finished, file_path))
+
+    def _export_blend(self, file_path, save_image, redo_mode):
+        """Write the result to file_path; with redo_mode the preview-sized result is first re-blended at full resolution."""
+        if redo_mode is not None:
+            save_image = self._compute_blend(redo_mode)
+        # Ensure the image is in a savable mode (e.g., RGB for JPEG)
+        if file_path.lower().endswith((".jpg", ".jpeg")) and save_image.mode == 'RGBA':
+            save_image = save_image.convert('RGB') # JPEG doesn't support alpha
+        save_image.save(file_path)
+
+    def _emit_save_finished(self, file_path, future):
+        error = future.exception()
+        self.saveFinished.emit(file_path, str(error) if error else "")
+
+    @Slot(str, str)
+    def _on_save_finished(self, file_path, error):
+        self.blend_button.setEnabled(True)
+        self.save_button.setEnabled(True)
+        if error:
+            QMessageBox.critical(self, "Save Error", f"Could not save image: {error}")
+        else:
+            QMessageBox.information(self, "Saved", f"Blended image saved to {file_path}")
 
 if __name__ == '__main__':
     app = QApplication(sys.argv)
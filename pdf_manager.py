@@ -1,44 +1,66 @@
-print("Script top-level: Starting imports...") # DEBUG
+import bisect
+import hashlib
+import importlib
+import importlib.util
 import io
 import json
 import logging
+import multiprocessing
 import os
+import shutil
 import subprocess # For opening files with external apps
 import sys
-import tempfile
+import threading
 import time # For preview regeneration delay
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait as wait_futures
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
 from functools import lru_cache, partial
+from pathlib import Path
 
 import fitz # PyMuPDF
 from PIL import Image, ImageQt, ExifTags, ImageOps, UnidentifiedImageError
 from PySide6.QtCore import (
-    QBuffer, QByteArray, QDir, QEvent, QIODevice,
+    QAbstractListModel, QModelIndex, QBuffer, QByteArray, QDir, QEvent, QIODevice,
     QItemSelectionModel, QMargins, QMetaObject, QPoint,
-    QRect, QSettings, QSize, Qt, QThread, QTimer, Signal,
+    QObject, QRect, QRunnable, QSettings, QSize, Qt, QThread, QThreadPool, QTimer, Signal,
     Slot, QStandardPaths
 )
 from PySide6.QtGui import (
-    QAction, QKeySequence, QPixmap, QImage, QPainter, QIcon, QColor, QPalette, QTransform
+    QAction, QKeySequence, QPixmap, QPixmapCache, QImage, QImageIOHandler, QImageReader, QImageWriter, QPainter, QIcon, QColor, QPalette, QTransform
 )
 from PySide6.QtCore import Qt, QSize, QTimer, QEvent, QPoint, QMimeData, QRect
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QListWidget, QListWidgetItem, QAbstractItemView, QSplitter,
+    QPushButton, QListView, QAbstractItemView, QSplitter,
     QCheckBox, QFileDialog, QDialog, QLineEdit, QSpinBox, QDialogButtonBox,
     QMessageBox, QProgressDialog, QSizePolicy, QStyle, QStyledItemDelegate,
     QSpacerItem, QGroupBox, QInputDialog
 )
-from pypdf import PdfReader, PdfWriter, Transformation
-from pypdf import errors as pypdf_errors # Import errors submodule
-# This assumes image_blender_gui.py is in the same directory or Python path
+# config.json is written the same way with or without orjson: UTF-8, two-space indent (orjson's only option)
 try:
-    from image_blender_gui import ImageBlenderWindow
-except ImportError:
-    ImageBlenderWindow = None
-    print("Warning: image_blender_gui.py not found. Image Blender functionality will be disabled.")
+    import orjson # Optional: faster config parsing and writing
+    _json_loads = orjson.loads
 
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _json_loads = json.loads
 
-print("Script top-level: Imports finished.") # DEBUG
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+try:
+    import img2pdf # Optional: lossless image embedding for PNG to PDF
+except ImportError:
+    img2pdf = None
+try:
+    import ahocorasick # pyahocorasick, optional: faster keyword matching
+except ImportError:
+    ahocorasick = None
+# This assumes image_blender_gui.py is in the same directory or Python path.
+# It pulls in numpy and JIT-compiles its kernels, so it is imported in the background after startup.
+IMAGE_BLENDER_AVAILABLE = importlib.util.find_spec('image_blender_gui') is not None
 
 # Configuration
 CONFIG_FILE = 'config.json'
@@ -53,111 +75,1004 @@ DEFAULT_ORDERING_KEYWORDS = {
     "other": 100
 }
 
+# Lowercase extensions, including the dot, as returned by file_extension().
+# Every code path dispatches on these sets, so a format MuPDF, img2pdf/Pillow and Qt
+# all read is supported by adding it here.
+IMAGE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.tif', '.tiff'})
+SOURCE_EXTENSIONS = IMAGE_EXTENSIONS | {'.pdf'} # Files listed from the source directory
+PREVIEW_EXTENSIONS = SOURCE_EXTENSIONS | {'.bmp', '.gif'}
+# Image modes Pillow's PDF writer embeds as they are
+PDF_IMAGE_MODES = frozenset({'1', 'L', 'P', 'RGB', 'CMYK'})
+
+# Settings changes are written at most this often
+CONFIG_SAVE_DELAY_MS = 500
+
 # Define A4 dimensions in points (1 point = 1/72 inch)
 A4_WIDTH_PT = 595.0 # Use float for precision
 A4_HEIGHT_PT = 842.0 # Use float for precision
 
+# Combines with at least this many files normalise their inputs in worker processes;
+# below it the pool startup costs more than it saves
+COMBINE_POOL_MIN_FILES = 4
+COMBINE_POOL_MAX_WORKERS = 4
+# Results a pool may hold ahead of the consumer; each one is a whole normalised document
+POOL_RESULTS_AHEAD = 2 * COMBINE_POOL_MAX_WORKERS
+# How often a wait on a pool result looks at the cancel flag, in seconds
+POOL_CANCEL_POLL_S = 0.2
+
+# Dropped files are copied this many at a time; the copies block in the kernel, not on the GIL
+COPY_MAX_WORKERS = 4
+
+# Images compressed below this are checked for being blank pages; a white A4 scan
+# is a few bytes per thousand pixels, real content far more
+BLANK_IMAGE_MAX_BYTES_PER_PIXEL = 0.01
+
+# existing_paths() lists a directory instead of stat()ing when it checks at least this many files in it
+EXISTS_SCAN_MIN_PATHS = 8
+
+# Open PDF documents kept by document_cache
+DOCUMENT_CACHE_MAX = 8
+# ...and closed once unused this long, in seconds: an open handle blocks editors that save by
+# rename, and deletes from outside the app, on Windows
+DOCUMENT_IDLE_CLOSE_S = 30
+# How often idle documents are looked for, in both processes
+DOCUMENT_IDLE_CHECK_MS = 10 * 1000
+
+# Source directory entries added to the list per event-loop turn while scanning
+SOURCE_SCAN_CHUNK = 500
+
+# Classified names remembered per keyword set
+CLASSIFY_CACHE_SIZE = 8192
+
+# Preview renders wait for resizes and list navigation to pause this long
+PREVIEW_DEBOUNCE_MS = 120
+# Rows on each side of the previewed one rendered ahead into the caches
+PREVIEW_PREFETCH_RADIUS = 2
+# Threads for preview jobs, kept apart from the global pool that runs combines and conversions
+PREVIEW_THREAD_COUNT = 2
+# A preview render or discard in the renderer process taking longer than this is given up on, in seconds
+PREVIEW_RENDER_TIMEOUT_S = 30
+# QPixmapCache budget for rendered previews, in KB
+PREVIEW_CACHE_LIMIT_KB = 64 * 1024
+# Rendered previews are also kept on disk across sessions, trimmed to this size at startup
+PREVIEW_DISK_CACHE_BUDGET = 200 * 1024 * 1024
+PREVIEW_DISK_CACHE_MAX_AGE_DAYS = 30
+
+# Worker processes are spawned, never forked: a fork would copy whatever locks the GUI's
+# threads (previews, MuPDF, the cache trim) hold at that moment into a child that can't release them.
+# Spawned children re-import this module, so its top level only defines things.
+MP_CONTEXT = multiprocessing.get_context('spawn')
+
 # Setup basic logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def preview_disk_cache_format():
+    """WebP where Qt's imageformats plugin provides it; PNG keeps transparency otherwise."""
+    # Asked on first use rather than at import, so worker processes never load the plugins
+    return 'webp' if b'webp' in QImageWriter.supportedImageFormats() else 'png'
+
+
+def spawn_detached(exe, *args):
+    """Launch an external GUI app without sharing our descriptors or process group."""
+    # Nothing of ours to read or write: the editor's console chatter shouldn't land in our terminal
+    kwargs = {'close_fds': True, 'stdin': subprocess.DEVNULL,
+              'stdout': subprocess.DEVNULL, 'stderr': subprocess.DEVNULL}
+    if os.name == 'posix':
+        kwargs['start_new_session'] = True
+    else:
+        # No console to attach to or allocate, so the launch doesn't wait on conhost either
+        kwargs['creationflags'] = subprocess.CREATE_NEW_PROCESS_GROUP | subprocess.DETACHED_PROCESS
+    return subprocess.Popen([os.fspath(exe), *map(os.fspath, args)], **kwargs)
+
+
+def existing_paths(paths):
+    """The subset of paths that exist, reading each directory once instead of stat()ing each file."""
+    by_dir = {}
+    for path in paths:
+        by_dir.setdefault(os.path.dirname(path), []).append(path)
+    present = set()
+    for directory, dir_paths in by_dir.items():
+        if len(dir_paths) < EXISTS_SCAN_MIN_PATHS:
+            # Listing a large directory costs more than a handful of stats
+            present.update(path for path in dir_paths if os.path.exists(path))
+            continue
+        try:
+            with os.scandir(directory or '.') as entries:
+                # normcase folds case on Windows, where "A.PDF" and "a.pdf" are the same file
+                names = {os.path.normcase(entry.name) for entry in entries}
+        except OSError:
+            continue # Missing or unreadable directory: none of its files are usable
+        present.update(path for path in dir_paths if os.path.normcase(os.path.basename(path)) in names)
+    return present
+
+def file_extension(path):
+    return os.path.splitext(path)[1].lower()
+
 def load_config():
     try:
-        with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = _json_loads(Path(CONFIG_FILE).read_bytes())
     except FileNotFoundError:
         logger.info(f"{CONFIG_FILE} not found. Using default configuration.")
         return {}
-    except json.JSONDecodeError:
+    except json.JSONDecodeError: # orjson.JSONDecodeError subclasses this
         logger.error(f"Error decoding {CONFIG_FILE}. Returning empty config.")
         return {}
     return config
 
 def save_config(config):
+    # Write beside the real file and swap it in, so a crash mid-write can't truncate the config
+    tmp_path = CONFIG_FILE + '.tmp'
     try:
-        with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=4)
-    except IOError as e:
+        Path(tmp_path).write_bytes(_json_dumps(config))
+        os.replace(tmp_path, CONFIG_FILE)
+    except (IOError, TypeError) as e:
         logger.error(f"Failed to save configuration to {CONFIG_FILE}: {e}")
 
-class PreviewWorker(QThread):
-    """Worker thread for generating file previews."""
-    previewReady = Signal(QPixmap, str)
+class KeywordClassifier:
+    """Maps lowercased filenames to the order of the first matching keyword (in dict order).
+
+    With pyahocorasick installed all keywords are matched in one automaton scan of the
+    name; otherwise each keyword is tested as a substring. orders_for() classifies a
+    whole directory listing at once. Results are memoised per name for the life of the classifier, which PDFToolApp keeps
+    until the keywords themselves change.
+    """
+
+    def __init__(self, ordering_keywords):
+        self.default_order = ordering_keywords.get("other", DEFAULT_ORDERING_KEYWORDS["other"])
+        self._items = [(keyword.lower(), order) for keyword, order in ordering_keywords.items() if keyword]
+        self._automaton = None
+        if ahocorasick and self._items:
+            self._automaton = ahocorasick.Automaton()
+            for index, (keyword, order) in enumerate(self._items):
+                if keyword not in self._automaton: # Keep the first of duplicate keywords
+                    self._automaton.add_word(keyword, (index, order))
+            self._automaton.make_automaton()
+        self._cache = {} # name_lower -> order; names recur across directory reloads
+
+    def order_for(self, name_lower):
+        order = self._cache.get(name_lower)
+        if order is None:
+            order = self._match(name_lower)
+            self._remember({name_lower: order})
+        return order
+
+    def orders_for(self, names_lower):
+        """order_for() over a list of names, each distinct name matched once."""
+        found = {}
+        misses = []
+        for name in dict.fromkeys(names_lower):
+            order = self._cache.get(name)
+            if order is None:
+                misses.append(name)
+            else:
+                found[name] = order
+        if misses:
+            computed = {name: self._match(name) for name in misses}
+            self._remember(computed)
+            found.update(computed)
+        return [found[name] for name in names_lower]
+
+    def _remember(self, orders_by_name):
+        # Bounded by flushing rather than LRU bookkeeping; reloads re-warm it in one pass
+        if len(self._cache) + len(orders_by_name) > CLASSIFY_CACHE_SIZE:
+            self._cache.clear()
+        self._cache.update(orders_by_name)
+
+    def _match(self, name_lower):
+        if self._automaton is not None:
+            # Matches arrive by position in the name; the lowest keyword index wins
+            best = min((value for _, value in self._automaton.iter(name_lower)), default=None)
+            return best[1] if best else self.default_order
+        for keyword, order in self._items:
+            if keyword in name_lower:
+                return order
+        return self.default_order
+
+class DocumentCache:
+    """A few recently used fitz Documents, kept open and keyed by (path, mtime).
+
+    PyMuPDF is not thread-safe, so use() holds a lock for as long as the document is
+    in use; preview and conversion workers take turns instead of re-parsing the file.
+    """
+
+    def __init__(self, max_docs=DOCUMENT_CACHE_MAX):
+        self.max_docs = max_docs
+        self._docs = OrderedDict() # (path, mtime) -> Document, least recently used first
+        self._released_at = {} # (path, mtime) -> time.monotonic() when use() last let go of it
+        self._lock = threading.RLock() # Re-entered when a holder of use() discards an output path
+        self._discard_hooks = [] # Called with each discarded path, for caches in other processes
+
+    @contextmanager
+    def use(self, path):
+        key = (path, os.path.getmtime(path))
+        with self._lock:
+            doc = self._docs.pop(key, None)
+            if doc is None:
+                self._close_matching(path) # Older revisions of the same file
+                doc = fitz.open(path)
+            self._docs[key] = doc
+            while len(self._docs) > self.max_docs:
+                self._close(next(iter(self._docs)))
+            try:
+                yield doc
+            finally:
+                self._released_at[key] = time.monotonic()
+
+    def discard(self, path):
+        """Close any handle on path; call before the file is overwritten or deleted.
+
+        Call it outside use(): the hooks can block, and would do so with the lock held.
+        """
+        with self._lock:
+            self._close_matching(path)
+        for hook in self._discard_hooks:
+            hook(path)
+
+    def add_discard_hook(self, hook):
+        self._discard_hooks.append(hook)
+
+    def remove_discard_hook(self, hook):
+        self._discard_hooks.remove(hook)
+
+    def shrink_store(self, percent=100, blocking=True):
+        """Drop MuPDF's cached page resources, which outlive the pixmaps rendered from them.
+
+        With blocking=False it gives up rather than wait for a document in use; returns whether it ran.
+        """
+        if not self._lock.acquire(blocking=blocking):
+            return False
+        try:
+            fitz.TOOLS.store_shrink(percent)
+        finally:
+            self._lock.release()
+        return True
+
+    def close_idle(self, max_idle=DOCUMENT_IDLE_CLOSE_S):
+        """Close documents unused for max_idle seconds; skipped if a document is in use right now."""
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            cutoff = time.monotonic() - max_idle
+            for key in [key for key in self._docs if self._released_at.get(key, cutoff) <= cutoff]:
+                self._close(key)
+        finally:
+            self._lock.release()
+
+    def close_all(self):
+        with self._lock:
+            for key in list(self._docs):
+                self._close(key)
+
+    def _close_matching(self, path):
+        for key in [key for key in self._docs if key[0] == path]:
+            self._close(key)
+
+    def _close(self, key):
+        self._docs.pop(key).close()
+        self._released_at.pop(key, None)
+
+# Shared by every thread that reads PDFs for previews and conversions
+document_cache = DocumentCache()
+
+def append_as_a4(out_doc, f_path, open_pdf=fitz.open):
+    """Append every page of an image or PDF to out_doc, each on its own A4 page.
+
+    open_pdf is a context manager factory for the source PDF; pass document_cache.use
+    to reuse a document the GUI process already has open.
+    """
+    # Landscape content is turned to portrait. show_pdf_page/insert_image keep the
+    # aspect ratio and centre within the target rect.
+    ext = file_extension(f_path)
+    if ext in IMAGE_EXTENSIONS:
+        with Image.open(f_path) as img: # Header only, for the orientation
+            landscape = img.width > img.height
+            blank = _is_blank_image(img, f_path)
+        target_page = out_doc.new_page(width=A4_WIDTH_PT, height=A4_HEIGHT_PT)
+        if not blank: # A white separator scan becomes an empty page, with nothing to decode or re-compress
+            target_page.insert_image(target_page.rect, filename=f_path, rotate=90 if landscape else 0)
+
+    elif ext == '.pdf':
+        with open_pdf(f_path) as src_doc:
+            for page in src_doc:
+                if _is_a4_portrait(page):
+                    # Already in shape: copy the page itself rather than wrapping it in a form XObject
+                    out_doc.insert_pdf(src_doc, from_page=page.number, to_page=page.number)
+                    continue
+                target_page = out_doc.new_page(width=A4_WIDTH_PT, height=A4_HEIGHT_PT)
+                rotate = 90 if page.rect.width > page.rect.height else 0
+                target_page.show_pdf_page(target_page.rect, src_doc, page.number, rotate=rotate)
+
+def _is_blank_image(img, f_path):
+    """True for a solid white image. Only files small enough for their pixel count to be blank are decoded."""
+    if os.path.getsize(f_path) > BLANK_IMAGE_MAX_BYTES_PER_PIXEL * img.width * img.height:
+        return False
+    return img.convert('RGB').getextrema() == ((255, 255),) * 3
+
+def _is_a4_portrait(page):
+    return (not page.rotation and abs(page.rect.width - A4_WIDTH_PT) < 1
+            and abs(page.rect.height - A4_HEIGHT_PT) < 1)
+
+def _is_a4_pdf(path):
+    with document_cache.use(path) as doc:
+        return doc.page_count > 0 and all(_is_a4_portrait(page) for page in doc)
+
+@contextmanager
+def atomic_output(path):
+    """Yield a scratch path beside path; once the block succeeds it replaces path in one rename.
+
+    Readers never see a half-written file, and a failed or killed write leaves the old one.
+    """
+    directory, name = os.path.split(os.path.abspath(path))
+    stem, ext = os.path.splitext(name)
+    # Same directory, so the rename stays on one filesystem; the extension is kept for writers that infer the format
+    tmp_path = os.path.join(directory, f".{stem}.partial-{os.urandom(4).hex()}{ext}")
+    try:
+        yield tmp_path
+        document_cache.discard(path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def bounded_imap(pool, func, items, ahead=POOL_RESULTS_AHEAD, canceled=None):
+    """Executor.map() that keeps at most ahead tasks in flight, yielding results in order.
+
+    Executor.map submits every task up front and holds results the consumer hasn't taken,
+    so a slow consumer lets finished documents pile up in memory. A worker process that
+    dies fails the wait with BrokenProcessPool; once canceled is set the iteration just stops.
+    """
+    pending = deque()
+    try:
+        for item in items:
+            if len(pending) >= ahead:
+                if not _wait_unless_canceled(pending[0], canceled):
+                    return
+                yield pending.popleft().result()
+            pending.append(pool.submit(func, item))
+        while pending:
+            if not _wait_unless_canceled(pending[0], canceled):
+                return
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel() # Drops queued tasks; one already running finishes in its worker
+
+def _wait_unless_canceled(future, canceled):
+    """Wait for future; False if canceled was set first."""
+    while canceled is None or not canceled.is_set():
+        if wait_futures([future], timeout=POOL_CANCEL_POLL_S).done:
+            return True
+    return False
+
+def combine_files(ordered_files, output_path, pool, canceled, report_progress):
+    """Combine ordered_files into one A4 PDF at output_path; returns "" if canceled is set.
+
+    With a process pool the inputs are normalised in parallel; bounded_imap keeps them in order.
+    """
+    if len(ordered_files) == 1 and file_extension(ordered_files[0]) == '.pdf' and _is_a4_pdf(ordered_files[0]):
+        # Nothing to normalise: a byte-for-byte copy beats a parse and rewrite
+        with atomic_output(output_path) as tmp_path:
+            shutil.copyfile(ordered_files[0], tmp_path)
+        report_progress(1)
+        return "Files combined successfully."
+
+    out_doc = fitz.open()
+    try:
+        if pool is not None:
+            for i, blob in enumerate(bounded_imap(pool, a4_pdf_bytes, ordered_files, canceled=canceled)):
+                if canceled.is_set(): return ""
+                with fitz.open("pdf", blob) as part:
+                    out_doc.insert_pdf(part)
+                report_progress(i + 1)
+        else:
+            for i, f_path in enumerate(ordered_files):
+                if canceled.is_set(): return ""
+                # Inputs were usually just previewed, so their documents are likely still open
+                append_as_a4(out_doc, f_path, open_pdf=document_cache.use)
+                report_progress(i + 1)
+        if canceled.is_set(): return ""
+        with atomic_output(output_path) as tmp_path:
+            out_doc.save(tmp_path, garbage=4, deflate=True)
+    finally:
+        out_doc.close()
+        document_cache.shrink_store()
+    return "Files combined successfully."
+
+def a4_pdf_bytes(f_path):
+    """Pool worker: one input normalised to A4 pages, as PDF bytes. Each call owns its documents."""
+    try:
+        with fitz.open() as doc:
+            append_as_a4(doc, f_path)
+            return doc.tobytes()
+    finally:
+        # Workers live for the whole session; without this MuPDF's store keeps every image it decoded
+        fitz.TOOLS.store_shrink(100)
+
+def preview_cache_dir():
+    """Directory for rendered preview thumbnails, created on first use."""
+    cache_dir = os.path.join(QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation), "previews")
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+def trim_preview_cache(cache_dir, budget=PREVIEW_DISK_CACHE_BUDGET, max_age_days=PREVIEW_DISK_CACHE_MAX_AGE_DAYS):
+    """Delete thumbnails unused for max_age_days, then the least recently used until the cache fits in budget bytes."""
+    entries = []
+    try:
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                if entry.is_file():
+                    st = entry.stat()
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+    except OSError as e:
+        logger.warning(f"Could not scan preview cache {cache_dir}: {e}")
+        return
+    total = sum(size for _, size, _ in entries)
+    # Previews of files that left the source folder would otherwise linger until the budget is hit
+    cutoff = time.time() - max_age_days * 86400
+    for mtime, size, path in sorted(entries):
+        if total <= budget and mtime >= cutoff:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError as e:
+            logger.warning(f"Could not remove cached preview {path}: {e}")
+
+class PreviewSignals(QObject):
+    """Signals for PreviewWorker; QRunnable itself can't carry signals."""
+    previewReady = Signal(str, QSize, QImage)
     errorOccurred = Signal(str)
+    # (path, size, device pixel ratio) the GUI currently wants; workers queued for anything else skip their render
+    wanted = None
+    # The same for the file whose list neighbours are being prefetched
+    prefetch_anchor = None
+
+
+def _render_first_page(doc, width, height):
+    """Pixmap of doc's first page fitted to width x height pixels, or None for an empty document."""
+    if doc.page_count == 0:
+        return None
+    page = doc.load_page(0)
+    # Rasterize straight at the size that fits the label
+    zoom = min(width / page.rect.width, height / page.rect.height)
+    return page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+
+def render_pdf_preview(pdf_path, width, height):
+    """PreviewRenderer entry point: (samples, width, height, stride) of page one, or None."""
+    # This process's own document_cache; the GUI process closes its handles through discard_document().
+    # MuPDF's store is left alone: the fonts and images it holds are what re-rendering an open document reuses,
+    # and the store's own size cap keeps it bounded.
+    with document_cache.use(pdf_path) as doc:
+        pix = _render_first_page(doc, width, height)
+        return None if pix is None else (pix.samples, pix.width, pix.height, pix.stride)
+
+def discard_document(path):
+    """PreviewRenderer entry point: close this process's handle on path."""
+    document_cache.discard(path)
+
+def close_idle_documents():
+    """PreviewRenderer entry point: close this process's documents that have gone unused."""
+    document_cache.close_idle()
+
+
+class PreviewRenderer:
+    """A worker process that rasterises PDF previews.
+
+    PyMuPDF holds the GIL while it renders, so in a thread it stalls the GUI's event loop;
+    in its own process it only costs the waiting thread a blocked read.
+    """
 
-    def __init__(self, file_path, preview_size, dpi, parent=None):
-        super().__init__(parent)
+    def __init__(self):
+        # Spawned: the trim and preview threads are already running. An executor rather than a
+        # Pool, so a child that dies fails the waiting call with BrokenProcessPool instead of hanging it
+        self._pool = ProcessPoolExecutor(1, mp_context=MP_CONTEXT)
+        self._ready = threading.Event()
+        # Until the process has started and imported this module, previews render in-process
+        self._pool.submit(os.getpid).add_done_callback(lambda f: f.cancelled() or f.exception() or self._ready.set())
+        # The process keeps recent documents open; a handle there would block overwrites
+        # and deletes on Windows, so every discard in this process is forwarded
+        document_cache.add_discard_hook(self.discard)
+
+    def ready(self):
+        return self._ready.is_set()
+
+    def render(self, pdf_path, width, height):
+        return self._call(render_pdf_preview, pdf_path, width, height)
+
+    def discard(self, path):
+        # Waits for the child so the handle is gone before the caller replaces or deletes the file;
+        # only PDFs are ever opened there, and nothing before the process was ready
+        if self._ready.is_set() and file_extension(path) == '.pdf':
+            try:
+                self._call(discard_document, path)
+            except BrokenProcessPool:
+                pass # The process, and its handle, are gone
+            except TimeoutError:
+                logger.warning(f"Preview renderer did not release {path} in time")
+
+    def close_idle(self):
+        # Queued without waiting; the child closes its own idle documents when it gets to it
+        if self._ready.is_set():
+            try:
+                self._pool.submit(close_idle_documents)
+            except BrokenProcessPool:
+                self._ready.clear()
+
+    def _call(self, func, *args):
+        try:
+            return self._pool.submit(func, *args).result(timeout=PREVIEW_RENDER_TIMEOUT_S)
+        except BrokenProcessPool:
+            # The child died; previews go back to rendering in-process for the rest of the session
+            self._ready.clear()
+            raise
+
+    def close(self):
+        document_cache.remove_discard_hook(self.discard)
+        self._pool.shutdown(cancel_futures=True)
+
+
+class PreviewWorker(QRunnable):
+    """Renders one file preview on PDFToolApp's preview QThreadPool."""
+
+    def __init__(self, file_path, preview_size, signals, cache_dir=None, device_pixel_ratio=1.0, stat=None, renderer=None,
+                 prefetch_anchor=None):
+        super().__init__()
         self.file_path = file_path
-        self.preview_size = preview_size
-        self.dpi = dpi
-        self._is_running = True
+        # Set for a neighbour rendered ahead of time: it runs only while that anchor is current, and fails quietly
+        self.prefetch_anchor = prefetch_anchor
+        self.renderer = renderer # PreviewRenderer for PDFs, if one is running
+        self.stat = stat # The GUI's os.stat() of file_path, if it already took one
+        self.preview_size = preview_size # Logical size of the label
+        self.signals = signals
+        self.cache_dir = cache_dir
+        self.device_pixel_ratio = device_pixel_ratio
+        # Rendered in device pixels so HiDPI screens get a sharp preview without a rescale
+        self.pixel_size = preview_size * device_pixel_ratio
+
+    @staticmethod
+    def _display_format(image):
+        """Convert to the format QPixmap.fromImage() uses as-is, so the GUI thread only wraps it."""
+        fmt = QImage.Format.Format_ARGB32_Premultiplied if image.hasAlphaChannel() else QImage.Format.Format_RGB32
+        return image if image.format() == fmt else image.convertToFormat(fmt)
+
+    def _scaled_to_fit(self, image):
+        """Scale a full-size decode (PNG, BMP, GIF) to the preview size."""
+        if image.isNull():
+            return image
+        target = image.size().scaled(self.pixel_size, Qt.AspectRatioMode.KeepAspectRatio)
+        if image.width() > 2 * target.width():
+            # A fast pass down to twice the target leaves the smooth filter a quarter-size
+            # input at most; the final smooth pass hides the nearest-neighbour step
+            image = image.scaled(target * 2, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.FastTransformation)
+        return image.scaled(target, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation)
+
+    def _disk_cache_path(self):
+        st = self.stat or os.stat(self.file_path)
+        key = f"{self.file_path}|{st.st_mtime}|{st.st_size}|{self.pixel_size.width()}x{self.pixel_size.height()}"
+        return os.path.join(self.cache_dir, hashlib.sha1(key.encode('utf-8')).hexdigest() + '.' + preview_disk_cache_format())
 
     def run(self):
-        if not self._is_running:
-            return
-
+        if self.prefetch_anchor is not None:
+            if self.signals.prefetch_anchor != self.prefetch_anchor:
+                return
+        elif self.signals.wanted != (self.file_path, self.preview_size, self.device_pixel_ratio):
+            return # The user moved on while this job sat in the queue
         try:
-            pixmap = None
-            if self.file_path.lower().endswith('.pdf'):
-                doc = fitz.open(self.file_path)
-                if doc.page_count > 0:
-                    page = doc.load_page(0)
-                    pix = page.get_pixmap(dpi=self.dpi)
-                    image = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format.Format_RGB888)
-                    pixmap = QPixmap.fromImage(image)
-                doc.close()
-            elif self.file_path.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp', '.gif')):
-                pixmap = QPixmap(self.file_path)
-
-            if pixmap and not pixmap.isNull():
-                scaled_pixmap = pixmap.scaled(self.preview_size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                if self._is_running:
-                    self.previewReady.emit(scaled_pixmap, self.file_path)
-            elif self._is_running:
-                self.errorOccurred.emit(f"Unsupported or invalid file: {os.path.basename(self.file_path)}")
+            cache_path = self._disk_cache_path() if self.cache_dir else None
+            if cache_path and os.path.exists(cache_path):
+                image = QImage(cache_path)
+                if not image.isNull():
+                    os.utime(cache_path) # Mark as recently used for trim_preview_cache
+                    image = self._display_format(image)
+                    image.setDevicePixelRatio(self.device_pixel_ratio)
+                    self.signals.previewReady.emit(self.file_path, self.preview_size, image)
+                    return
+
+            image = None
+            ext = file_extension(self.file_path)
+            if ext == '.pdf':
+                width, height = self.pixel_size.width(), self.pixel_size.height()
+                if self.renderer is not None and self.renderer.ready():
+                    rendered = self.renderer.render(self.file_path, width, height)
+                    if rendered is not None:
+                        samples, w, h, stride = rendered
+                        image = QImage(samples, w, h, stride, QImage.Format.Format_RGB888)
+                        image = image.convertToFormat(QImage.Format.Format_RGB32)
+                else:
+                    with document_cache.use(self.file_path) as doc:
+                        pix = _render_first_page(doc, width, height)
+                        if pix is not None:
+                            # Wrap pix's own buffer (samples would copy it first); the one conversion below
+                            # gives the image its own pixels before pix goes away and before it crosses threads
+                            image = QImage(pix.samples_mv, pix.width, pix.height, pix.stride, QImage.Format.Format_RGB888)
+                            image = image.convertToFormat(QImage.Format.Format_RGB32)
+                            del pix
+            elif ext in PREVIEW_EXTENSIONS:
+                reader = QImageReader(self.file_path)
+                source_size = reader.size()
+                if not source_size.isValid():
+                    image = reader.read()
+                elif reader.supportsOption(QImageIOHandler.ImageOption.ScaledSize):
+                    # Decode straight to the preview size; JPEG scales during the DCT, so a
+                    # full-resolution photo is never materialised just to be shrunk
+                    reader.setScaledSize(source_size.scaled(self.pixel_size, Qt.AspectRatioMode.KeepAspectRatio))
+                    image = reader.read()
+                else:
+                    image = self._scaled_to_fit(reader.read())
+
+            if image is not None and not image.isNull():
+                if cache_path:
+                    image.save(cache_path, preview_disk_cache_format())
+                image = self._display_format(image)
+                image.setDevicePixelRatio(self.device_pixel_ratio)
+                self.signals.previewReady.emit(self.file_path, self.preview_size, image)
+            elif self.prefetch_anchor is None:
+                self.signals.errorOccurred.emit(f"Unsupported or invalid file: {os.path.basename(self.file_path)}")
         except Exception as e:
             logger.error(f"Error generating preview for {self.file_path}: {e}")
-            if self._is_running:
-                self.errorOccurred.emit(f"Error: {e}")
+            if self.prefetch_anchor is None:
+                self.signals.errorOccurred.emit(f"Error: {e}")
+
+
+def _sole_page_image(doc, page):
+    """extract_image() dict for a page that is one unmasked, upright, full-page image and nothing else."""
+    images = page.get_images(full=True)
+    if len(images) != 1 or images[0][1] != 0 or page.rotation: # images[0][1] is the soft-mask xref
+        return None
+    placements = page.get_image_rects(images[0][0], transform=True)
+    if len(placements) != 1:
+        return None
+    rect, matrix = placements[0]
+    if matrix.b or matrix.c or matrix.a <= 0 or matrix.d <= 0: # Rotated, skewed or mirrored
+        return None
+    if abs(rect & page.rect) < 0.99 * abs(page.rect):
+        return None
+    if page.get_text("text").strip() or page.get_drawings():
+        return None
+    return doc.extract_image(images[0][0])
+
+def pdf_first_page_to_png(pdf_path, output_path, dpi, report_progress):
+    # use() is the inner block so its lock is released before atomic_output's discard runs the
+    # discard hooks, which wait on the preview process and must not hold up other cache users
+    with atomic_output(output_path) as tmp_path, document_cache.use(pdf_path) as doc:
+        page = doc.load_page(0)
+        info = _sole_page_image(doc, page)
+        try:
+            # Scans: hand back the embedded image at its own resolution instead of re-rasterising it
+            if info and info["ext"] == "png":
+                with open(tmp_path, "wb") as f_out:
+                    f_out.write(info["image"])
+            elif info:
+                with Image.open(io.BytesIO(info["image"])) as img:
+                    if img.mode not in ('1', 'L', 'LA', 'P', 'RGB', 'RGBA'):
+                        img = img.convert('RGB') # e.g. CMYK JPEGs, which PNG can't hold
+                    img.save(tmp_path, "PNG")
+        except (OSError, UnidentifiedImageError) as e:
+            logger.info(f"Embedded image of {pdf_path} not usable, rendering instead: {e}")
+            info = None
+        if not info:
+            pix = page.get_pixmap(dpi=dpi)
+            pix.save(tmp_path)
+            del pix # A full-DPI page; don't leave it for the garbage collector
+    document_cache.shrink_store()
+    report_progress(1)
+    return "PDF converted to PNG."
+
+def _image_to_pdf_bytes(img_path):
+    """Single-page PDF for one image; img2pdf embeds PNG/JPEG streams without re-encoding."""
+    if img2pdf is not None:
+        try:
+            return img2pdf.convert(img_path)
+        except Exception as e: # e.g. img2pdf.AlphaChannelError for transparent PNGs
+            logger.info(f"img2pdf could not embed {img_path}, re-encoding with Pillow: {e}")
+    with Image.open(img_path) as img:
+        if img.format == 'JPEG' and img.mode in ('L', 'RGB'):
+            # Only the header has been read; MuPDF embeds the file's DCT stream as it is, where
+            # Pillow would decode it and save a second-generation JPEG. Same 72 dpi page size as Pillow.
+            width, height = img.size
+            with fitz.open() as doc:
+                doc.new_page(width=width, height=height).insert_image(fitz.Rect(0, 0, width, height), filename=img_path)
+                return doc.tobytes()
+        if img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info):
+            img = img.convert('RGBA') if img.mode == 'P' else img
+            if img.getchannel('A').getextrema()[0] == 255:
+                # Most "RGBA" PNGs are fully opaque; flattening them would only copy the pixels twice more
+                img = img.convert('RGB' if img.mode == 'RGBA' else 'L')
+            else:
+                # Flatten onto white in one C pass; convert('RGB') alone would drop the alpha
+                # and show whatever colour the transparent pixels happen to store, usually black
+                img = Image.alpha_composite(Image.new('RGBA', img.size, (255, 255, 255, 255)), img.convert('RGBA')).convert('RGB')
+        elif img.mode not in PDF_IMAGE_MODES:
+            img = img.convert('RGB') # e.g. 16-bit greyscale, which the PDF writer rejects
+        buf = io.BytesIO()
+        img.save(buf, "PDF")
+    return buf.getvalue()
+
+def images_to_pdf(image_paths, output_path, pool, report_progress):
+    """One PDF page per image; with a process pool the images are encoded in parallel."""
+    out_doc = fitz.open()
+    try:
+        # Single-page PDFs built in memory; MuPDF grafts each page's objects across without re-encoding
+        blobs = bounded_imap(pool, _image_to_pdf_bytes, image_paths) if pool is not None else map(_image_to_pdf_bytes, image_paths)
+        for i, blob in enumerate(blobs):
+            with fitz.open("pdf", blob) as part:
+                out_doc.insert_pdf(part)
+            report_progress(i + 1)
+        with atomic_output(output_path) as tmp_path:
+            out_doc.save(tmp_path, garbage=4, deflate=True)
+    finally:
+        out_doc.close()
+    return f"{len(image_paths)} image(s) converted to PDF."
+
+
+def _copy_one(src, dst):
+    # copyfile takes the in-kernel sendfile/copy_file_range path where the OS has one
+    document_cache.discard(dst)
+    shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+def copy_files(plan, skipped, report_progress):
+    """Copy each (src, dst) pair in plan; skipped counts files the caller left out."""
+    if len(plan) == 1:
+        _copy_one(*plan[0])
+        report_progress(1)
+    else:
+        with ThreadPoolExecutor(max_workers=COPY_MAX_WORKERS) as executor:
+            futures = [executor.submit(_copy_one, src, dst) for src, dst in plan]
+            for i, future in enumerate(as_completed(futures)):
+                future.result() # Re-raise the first failure for the worker's error signal
+                report_progress(i + 1)
+    message = f"Copied {len(plan)} file(s) into the source directory."
+    if skipped:
+        message += f" Skipped {skipped} that already exist there."
+    return message
+
+
+def delete_files(paths, report_progress):
+    """Delete paths, carrying on past failures; returns one "name: reason" line per file left behind."""
+    errors = []
+    for i, path in enumerate(paths):
+        document_cache.discard(path)
+        try:
+            os.remove(path)
+        except OSError as e:
+            errors.append(f"{os.path.basename(path)}: {e.strerror or e}")
+        report_progress(i + 1)
+    return "\n".join(errors)
+
+
+class ConversionSignals(QObject):
+    """Signals for ConversionWorker."""
+    progress = Signal(int)
+    finished = Signal(str) # Success message, or "" if the work was canceled
+    errorOccurred = Signal(str)
+
 
-    def stop(self):
-        self._is_running = False
+class ConversionWorker(QRunnable):
+    """Runs work(report_progress) on the global QThreadPool; work must not touch widgets."""
+
+    def __init__(self, work, signals):
+        super().__init__()
+        self.work = work
+        self.signals = signals
+
+    def run(self):
+        try:
+            message = self.work(self.signals.progress.emit)
+        except Exception as e:
+            logger.error(f"Conversion failed: {e}", exc_info=True)
+            self.signals.errorOccurred.emit(str(e))
+        else:
+            self.signals.finished.emit(message)
 
 
-class OrderableListItemWidget(QWidget):
-    orderAttempted = Signal()
+class SourceFilesModel(QAbstractListModel):
+    """Flat list of file paths for the source view; Qt only asks for rows it shows."""
 
-    def __init__(self, filename, full_path, initial_order, parent=None):
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.full_path = full_path
-        
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(5, 2, 5, 2)
-        
-        self.order_spinbox = QSpinBox()
-        self.order_spinbox.setMinimum(1)
-        self.order_spinbox.setMaximum(9999) 
-        self.order_spinbox.setValue(initial_order)
-        self.order_spinbox.setFixedWidth(60)
-        self.order_spinbox.valueChanged.connect(self.orderAttempted.emit)
-        layout.addWidget(self.order_spinbox)
-        
-        self.filename_label = QLabel(filename)
-        self.filename_label.setToolTip(full_path)
-        layout.addWidget(self.filename_label, 1)
-        
-        self.setLayout(layout)
+        self._paths = []
+        self._names = [] # basename of each path, split once rather than on every repaint
+        self._row_of = {} # path -> row, for finding a file without scanning the list
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._paths)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        path = self._paths[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._names[index.row()]
+        if role in (Qt.ItemDataRole.UserRole, Qt.ItemDataRole.ToolTipRole):
+            return path
+        return None
+
+    def set_paths(self, paths):
+        self.beginResetModel()
+        self._paths = list(paths)
+        self._names = [os.path.basename(path) for path in self._paths]
+        self._row_of = {path: row for row, path in enumerate(self._paths)}
+        self.endResetModel()
+
+    def append_paths(self, paths):
+        if not paths:
+            return
+        self.beginInsertRows(QModelIndex(), len(self._paths), len(self._paths) + len(paths) - 1)
+        self._row_of.update((path, row) for row, path in enumerate(paths, len(self._paths)))
+        self._paths.extend(paths)
+        self._names.extend(os.path.basename(path) for path in paths)
+        self.endInsertRows()
+
+    def reorder(self, paths):
+        """Show the same paths in a new order, keeping the selection and current item."""
+        self.layoutAboutToBeChanged.emit()
+        old_persistent = self.persistentIndexList()
+        old_paths = [self._paths[index.row()] for index in old_persistent]
+        name_of = dict(zip(self._paths, self._names))
+        self._paths = list(paths)
+        self._names = [name_of[path] for path in self._paths]
+        self._row_of = {path: row for row, path in enumerate(self._paths)}
+        self.changePersistentIndexList(old_persistent, [self.index(self._row_of[path]) for path in old_paths])
+        self.layoutChanged.emit()
+
+    def index_of(self, path):
+        row = self._row_of.get(path)
+        return QModelIndex() if row is None else self.index(row)
+
+
+class SelectedFilesModel(QAbstractListModel):
+    """Files queued for combining as [order, name, path] rows, in combine order."""
+    OrderRole = Qt.ItemDataRole.UserRole + 1
+    PathRole = Qt.ItemDataRole.UserRole + 2
+    NameRole = Qt.ItemDataRole.UserRole + 3
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._path_set = set() # Paths in _rows, for O(1) duplicate checks
+        self.repositioning = False # True while reposition() moves a row, so rowsMoved isn't taken for a drag
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        order, name, path = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"{order:>3}  {name}"
+        if role in (Qt.ItemDataRole.EditRole, self.OrderRole):
+            return order
+        if role in (Qt.ItemDataRole.ToolTipRole, self.PathRole):
+            return path
+        if role == self.NameRole:
+            return name
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or role not in (Qt.ItemDataRole.EditRole, self.OrderRole):
+            return False
+        self._rows[index.row()][0] = int(value)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole, self.OrderRole])
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.ItemIsDropEnabled # Drops land between rows, never onto one
+        return super().flags(index) | Qt.ItemFlag.ItemIsEditable | Qt.ItemFlag.ItemIsDragEnabled
+
+    def supportedDropActions(self):
+        return Qt.DropAction.MoveAction
+
+    def moveRows(self, source_parent, source_row, count, destination_parent, destination_child):
+        # QListView's InternalMove calls this directly, so a drag never round-trips through mime data
+        if not self.beginMoveRows(source_parent, source_row, source_row + count - 1, destination_parent, destination_child):
+            return False
+        moved = self._rows[source_row:source_row + count]
+        del self._rows[source_row:source_row + count]
+        if destination_child > source_row:
+            destination_child -= count
+        self._rows[destination_child:destination_child] = moved
+        self.endMoveRows()
+        return True
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+        if parent.isValid() or row < 0 or row + count > len(self._rows):
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        self._path_set.difference_update(path for _, _, path in self._rows[row:row + count])
+        del self._rows[row:row + count]
+        self.endRemoveRows()
+        return True
+
+    def paths(self):
+        return [path for _, _, path in self._rows]
+
+    def contains_path(self, path):
+        return path in self._path_set
+
+    def max_order(self):
+        # Rows are kept sorted by order (add_rows, reposition, renumber), so the last one holds it
+        return self._rows[-1][0] if self._rows else 0
+
+    def add_rows(self, rows):
+        """Insert (order, name, path) rows in one batch and keep the list sorted by order."""
+        if not rows:
+            return
+        new_rows = sorted([order, name, path] for order, name, path in rows)
+        # Rows ordered after everything already listed need no re-layout, only the insert
+        in_place = not self._rows or (new_rows[0][0], new_rows[0][1]) >= (self._rows[-1][0], self._rows[-1][1])
+        self.beginInsertRows(QModelIndex(), len(self._rows), len(self._rows) + len(new_rows) - 1)
+        self._rows.extend(new_rows)
+        self._path_set.update(path for _, _, path in new_rows)
+        self.endInsertRows()
+        if not in_place:
+            self.sort_by_order()
+
+    def sort_by_order(self):
+        keys = [(r[0], r[1]) for r in self._rows]
+        if all(a <= b for a, b in zip(keys, keys[1:])):
+            return # An edit that keeps a row in place needs no layout pass or persistent-index remap
+        self.layoutAboutToBeChanged.emit()
+        old_persistent = self.persistentIndexList()
+        old_rows = [self._rows[index.row()] for index in old_persistent]
+        self._rows.sort(key=lambda r: (r[0], r[1]))
+        position = {id(r): i for i, r in enumerate(self._rows)}
+        self.changePersistentIndexList(old_persistent, [self.index(position[id(r)]) for r in old_rows])
+        self.layoutChanged.emit()
+
+    def reposition(self, row):
+        """Move a single row whose order was edited to its sorted place, leaving the rest untouched."""
+        rows = self._rows
+        key = (rows[row][0], rows[row][1])
+        if row > 0 and key < (rows[row - 1][0], rows[row - 1][1]):
+            keys = [(r[0], r[1]) for r in rows[:row]]
+            dest = bisect.bisect_right(keys, key)
+        elif row + 1 < len(rows) and key > (rows[row + 1][0], rows[row + 1][1]):
+            keys = [(r[0], r[1]) for r in rows[row + 1:]]
+            dest = row + 1 + bisect.bisect_left(keys, key)
+        else:
+            return # Still between its neighbours, which is where most edits leave a row
+        # Equal orders fall back to the name, so a clash with another row needs no swap
+        self.repositioning = True
+        try:
+            self.moveRows(QModelIndex(), row, 1, QModelIndex(), dest)
+        finally:
+            self.repositioning = False
+
+    def renumber(self, step=10):
+        """Rewrite the orders to match the current row sequence."""
+        changed = []
+        for i, r in enumerate(self._rows):
+            if r[0] != (i + 1) * step:
+                r[0] = (i + 1) * step
+                changed.append(i)
+        if changed:
+            # A drag usually disturbs only the rows between its source and destination
+            self.dataChanged.emit(self.index(changed[0]), self.index(changed[-1]), [Qt.ItemDataRole.DisplayRole, self.OrderRole])
+
+
+class SelectedFileDelegate(QStyledItemDelegate):
+    """Edits a row's order with a spin box that only exists while the row is being edited."""
+
+    def createEditor(self, parent, option, index):
+        editor = QSpinBox(parent)
+        editor.setRange(1, 9999)
+        return editor
+
+    def setEditorData(self, editor, index):
+        editor.setValue(index.data(SelectedFilesModel.OrderRole))
+
+    def setModelData(self, editor, model, index):
+        editor.interpretText()
+        model.setData(index, editor.value(), SelectedFilesModel.OrderRole)
+        model.reposition(index.row())
 
-    def get_order(self):
-        return self.order_spinbox.value()
-        
-    def set_order(self, order, silent=True):
-        if silent:
-            self.order_spinbox.blockSignals(True)
-        self.order_spinbox.setValue(order)
-        if silent:
-            self.order_spinbox.blockSignals(False)
 
 class SettingsDialog(QDialog):
     def __init__(self, current_inkscape_path, current_gimp_path,
@@ -257,6 +1172,7 @@ class PDFToolApp(QMainWindow):
     def __init__(self):
         super().__init__()
         self.config = load_config()
+        loaded_keys = set(self.config)
         self.config.setdefault('factory_paperwork_dir', None)
         self.config.setdefault('delete_after_conversion', False)
         self.config.setdefault('delete_after_combination', False)
@@ -264,14 +1180,57 @@ class PDFToolApp(QMainWindow):
         self.config.setdefault('pdf_to_png_dpi', 150)
         self.config.setdefault('show_preview', True)
         self.config.setdefault('ordering_keywords', DEFAULT_ORDERING_KEYWORDS)
+        self._config_dirty = set(self.config) != loaded_keys # Write filled-in defaults back once
         
-        self.preview_worker = None
+        self.preview_signals = PreviewSignals(self)
+        # Preview jobs may wait on the renderer process; on their own threads they never hold up a combine
+        self._preview_pool = QThreadPool(self)
+        self._preview_pool.setMaxThreadCount(PREVIEW_THREAD_COUNT)
+        self.preview_signals.previewReady.connect(self._on_preview_generated)
+        self.preview_signals.errorOccurred.connect(self.statusBar().showMessage)
+        QPixmapCache.setCacheLimit(PREVIEW_CACHE_LIMIT_KB) # Shared with the style's own cached pixmaps
+        try:
+            self.preview_disk_cache_dir = preview_cache_dir()
+            # A full cache directory takes a while to stat; keep that off the startup path
+            threading.Thread(target=trim_preview_cache, args=(self.preview_disk_cache_dir,), daemon=True).start()
+        except OSError as e:
+            logger.warning(f"Preview disk cache disabled: {e}")
+            self.preview_disk_cache_dir = None
+        self.last_previewed_path = None
+        self._preview_stat = None # os.stat() of last_previewed_path, taken once per visit
+        self._shown_preview_key = None # Cache key of the pixmap on preview_label, if any
+        self._preview_neighbours = [] # Rows around last_previewed_path, prefetched once it is shown
+        self._preview_timer = QTimer(self) # Coalesces resize and selection bursts into one render
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(PREVIEW_DEBOUNCE_MS)
+        self._preview_timer.timeout.connect(self._render_pending_preview)
+        self._config_save_timer = QTimer(self) # Coalesces bursts of settings changes into one write
+        self._config_save_timer.setSingleShot(True)
+        self._config_save_timer.setInterval(CONFIG_SAVE_DELAY_MS)
+        self._config_save_timer.timeout.connect(self._flush_config)
+        self._idle_documents_timer = QTimer(self)
+        self._idle_documents_timer.setInterval(DOCUMENT_IDLE_CHECK_MS)
+        self._idle_documents_timer.timeout.connect(self._close_idle_documents)
+        self._idle_documents_timer.start()
+        QApplication.instance().aboutToQuit.connect(self._flush_config)
         self.image_blender_window = None
+        self._kw_classifier = None # Dropped by Settings when ordering_keywords changes
+        self._combine_pool = None # Worker processes for large combines, started on first use
+        self._preview_renderer = None # Started just after the window, so startup doesn't wait on it
+        self._combining = False # A combine worker is running, possibly past a canceled dialog
+        self._source_scan = None # Generator of the directory scan in progress, if any
+        self._source_scan_rows = []
+        self._select_after_scan = [] # Paths to select once the running scan completes
+        self._refresh_exec_exists()
         self._init_ui()
         self._load_all_lists()
+        QTimer.singleShot(0, self._start_preview_renderer)
+        if IMAGE_BLENDER_AVAILABLE:
+            QTimer.singleShot(0, self._warm_blender_import)
+        else:
+            logger.warning("image_blender_gui.py not found. Image Blender functionality will be disabled.")
         self.setWindowTitle("PDF Management Tool")
         self.setGeometry(100, 100, 1400, 900)
-        self.resizeEvent = self._on_resize_event
 
     def _init_ui(self):
         main_widget = QWidget()
@@ -301,11 +1260,15 @@ class PDFToolApp(QMainWindow):
         # Source List Group
         source_group = QGroupBox("Available Files")
         source_group_layout = QVBoxLayout(source_group)
-        self.source_files_list = QListWidget()
+        self.source_files_model = SourceFilesModel(self)
+        self.source_files_list = QListView()
+        self.source_files_list.setModel(self.source_files_model)
+        self.source_files_list.setUniformItemSizes(True)
+        self.source_files_list.setLayoutMode(QListView.LayoutMode.Batched)
         self.source_files_list.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
-        self.source_files_list.itemSelectionChanged.connect(self._update_button_states)
-        self.source_files_list.itemDoubleClicked.connect(self._add_to_selected_list_handler)
-        self.source_files_list.itemClicked.connect(self._on_source_item_clicked)
+        self.source_files_list.selectionModel().selectionChanged.connect(self._update_button_states)
+        self.source_files_list.doubleClicked.connect(self._add_to_selected_list_handler)
+        self.source_files_list.clicked.connect(self._on_source_item_clicked)
         source_group_layout.addWidget(self.source_files_list)
         left_layout.addWidget(source_group)
 
@@ -317,13 +1280,18 @@ class PDFToolApp(QMainWindow):
         # Combine List Group
         combine_group = QGroupBox("Files to Combine (Drag to Reorder)")
         combine_group_layout = QVBoxLayout(combine_group)
-        self.selected_files_list = QListWidget()
+        self.selected_files_model = SelectedFilesModel(self)
+        self.selected_files_list = QListView()
+        self.selected_files_list.setModel(self.selected_files_model)
+        self.selected_files_list.setItemDelegate(SelectedFileDelegate(self.selected_files_list))
+        self.selected_files_list.setUniformItemSizes(True)
+        self.selected_files_list.setEditTriggers(QAbstractItemView.EditTrigger.DoubleClicked | QAbstractItemView.EditTrigger.EditKeyPressed)
         self.selected_files_list.setDragDropMode(QAbstractItemView.DragDropMode.InternalMove)
         self.selected_files_list.setDefaultDropAction(Qt.DropAction.MoveAction)
         self.selected_files_list.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
-        self.selected_files_list.itemSelectionChanged.connect(self._update_button_states)
-        self.selected_files_list.itemClicked.connect(self._on_selected_item_clicked)
-        self.selected_files_list.model().rowsMoved.connect(self._handle_rows_moved)
+        self.selected_files_list.selectionModel().selectionChanged.connect(self._update_button_states)
+        self.selected_files_list.clicked.connect(self._on_selected_item_clicked)
+        self.selected_files_model.rowsMoved.connect(self._handle_rows_moved)
         combine_group_layout.addWidget(self.selected_files_list)
         left_layout.addWidget(combine_group)
 
@@ -342,6 +1310,8 @@ class PDFToolApp(QMainWindow):
         self.preview_label.setMinimumSize(200, 200)
         self.preview_label.setStyleSheet("border: 1px solid gray; background-color: #f0f0f0;")
         self.preview_label.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Ignored)
+        # Watches the label itself: splitter drags resize it without resizing the window
+        self.preview_label.installEventFilter(self)
         preview_layout.addWidget(self.preview_label, 1)
         top_splitter.addWidget(self.preview_widget)
         top_splitter.setSizes([400, 600]) # Initial ratio
@@ -401,7 +1371,7 @@ class PDFToolApp(QMainWindow):
         self.btn_settings = QPushButton("Settings")
         self.btn_settings.clicked.connect(self._show_settings_dialog)
         settings_layout.addWidget(self.btn_settings)
-        if ImageBlenderWindow:
+        if IMAGE_BLENDER_AVAILABLE:
             self.btn_open_blender = QPushButton("Open Image Blender")
             self.btn_open_blender.clicked.connect(self._open_image_blender)
             settings_layout.addWidget(self.btn_open_blender)
@@ -411,15 +1381,33 @@ class PDFToolApp(QMainWindow):
         self.setAcceptDrops(True)
         self._update_button_states()
 
-    def _on_source_item_clicked(self, item):
+    def _on_source_item_clicked(self, index):
         self.selected_files_list.clearSelection()
-        self._update_preview(item.data(Qt.ItemDataRole.UserRole))
+        self._update_preview(index.data(Qt.ItemDataRole.UserRole), self._neighbour_paths(index, Qt.ItemDataRole.UserRole))
+
+    @staticmethod
+    def _neighbour_paths(index, role):
+        """Paths of the rows around index, nearest first and the next row before the previous."""
+        model, row = index.model(), index.row()
+        rows = [row + step * side for step in range(1, PREVIEW_PREFETCH_RADIUS + 1) for side in (1, -1)]
+        return [model.index(r, 0).data(role) for r in rows if 0 <= r < model.rowCount()]
+
+    def _select_source_paths(self, paths):
+        selection = self.source_files_list.selectionModel()
+        indexes = [index for index in map(self.source_files_model.index_of, paths) if index.isValid()]
+        if not indexes:
+            return
+        selection.clearSelection()
+        for index in indexes:
+            selection.select(index, QItemSelectionModel.SelectionFlag.Select)
+        self.source_files_list.scrollTo(indexes[0])
 
-    def _on_selected_item_clicked(self, item):
+    def _selected_source_paths(self):
+        return [index.data(Qt.ItemDataRole.UserRole) for index in self.source_files_list.selectionModel().selectedRows()]
+
+    def _on_selected_item_clicked(self, index):
         self.source_files_list.clearSelection()
-        widget = self.selected_files_list.itemWidget(item)
-        if widget:
-            self._update_preview(widget.full_path)
+        self._update_preview(index.data(SelectedFilesModel.PathRole), self._neighbour_paths(index, SelectedFilesModel.PathRole))
 
     def _show_settings_dialog(self):
         dialog = SettingsDialog(
@@ -431,20 +1419,41 @@ class PDFToolApp(QMainWindow):
             parent=self
         )
         if dialog.exec():
-            self.config['inkscape_path'] = dialog.new_inkscape_path
-            self.config['gimp_path'] = dialog.new_gimp_path
-            self.config['libreoffice_draw_path'] = dialog.new_libreoffice_draw_path
-            self.config['ordering_keywords'] = dialog.new_ordering_keywords
-            self.config['pdf_to_png_dpi'] = dialog.new_pdf_to_png_dpi
-            save_config(self.config)
+            new_settings = {
+                'inkscape_path': dialog.new_inkscape_path,
+                'gimp_path': dialog.new_gimp_path,
+                'libreoffice_draw_path': dialog.new_libreoffice_draw_path,
+                'ordering_keywords': dialog.new_ordering_keywords,
+                'pdf_to_png_dpi': dialog.new_pdf_to_png_dpi,
+            }
+            if all(self.config.get(key) == value for key, value in new_settings.items()):
+                return # OK without edits: nothing to save, re-stat or reload
+            keywords_changed = dialog.new_ordering_keywords != self.config.get('ordering_keywords', DEFAULT_ORDERING_KEYWORDS)
+            self.config.update(new_settings)
+            if keywords_changed:
+                self._kw_classifier = None
+            self._refresh_exec_exists()
+            self._save_config_later()
             self.statusBar().showMessage("Settings saved.", 3000)
-            self._resort_combine_list()
+            # The source list is ordered by keyword; nothing else in Settings affects either list
+            if keywords_changed:
+                self._load_source_list()
+            self._update_button_states()
+
+    def _refresh_exec_exists(self):
+        # External tool paths only change through Settings, so stat them once per change
+        self._exec_exists = {
+            key: bool(self.config.get(key)) and os.path.exists(self.config[key])
+            for key in ('inkscape_path', 'gimp_path', 'libreoffice_draw_path')
+        }
 
     def _set_factory_paperwork_dir(self):
         directory = QFileDialog.getExistingDirectory(self, "Select Source Directory", self.config['factory_paperwork_dir'] or QDir.homePath())
         if directory:
-            self.config['factory_paperwork_dir'] = directory
-            save_config(self.config)
+            # Re-picking the same directory still reloads it, which is how the list is refreshed
+            if directory != self.config['factory_paperwork_dir']:
+                self.config['factory_paperwork_dir'] = directory
+                self._save_config_later()
             self._load_all_lists()
 
     def _load_all_lists(self):
@@ -453,275 +1462,356 @@ class PDFToolApp(QMainWindow):
         self._update_button_states()
 
     def _load_source_list(self):
-        self.source_files_list.clear()
+        self.source_files_model.set_paths([])
+        self._source_scan = None # Abandons any scan still in progress
         path = self.config.get('factory_paperwork_dir')
         self.factory_paperwork_dir_label.setText(f"Source: {path or 'Not set'}")
         if path and os.path.isdir(path):
-            try:
-                files = [f for f in os.listdir(path) if f.lower().endswith(('.pdf', '.png', '.jpg', '.jpeg'))]
-                files.sort()
-                for filename in files:
-                    full_path = os.path.join(path, filename)
-                    item = QListWidgetItem(filename)
-                    item.setData(Qt.ItemDataRole.UserRole, full_path)
-                    self.source_files_list.addItem(item)
-                self.factory_paperwork_dir_label.setText(f"Source ({len(files)} items): {path}")
-            except Exception as e:
-                logger.error(f"Failed to load source list: {e}")
-                self.statusBar().showMessage(f"Error loading files: {e}", 5000)
+            self._source_scan = self._iter_source_dir(path, self._keyword_classifier())
+            self._source_scan_rows = []
+            # The first chunk lands synchronously, so small directories never show a partial list
+            self._pump_source_scan(self._source_scan, path)
+
+    @staticmethod
+    def _iter_source_dir(path, classifier):
+        """Yield (order, name_lower, path) rows in unsorted chunks of SOURCE_SCAN_CHUNK."""
+        # One scandir pass; the lowered name is reused for the order key and the sort
+        names, paths = [], []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                # Only names that pass the extension test are lowered in full
+                if file_extension(entry.name) not in SOURCE_EXTENSIONS or not entry.is_file():
+                    continue
+                names.append(entry.name.lower())
+                paths.append(entry.path)
+                if len(names) >= SOURCE_SCAN_CHUNK:
+                    yield list(zip(classifier.orders_for(names), names, paths))
+                    names, paths = [], []
+        yield list(zip(classifier.orders_for(names), names, paths))
+
+    def _pump_source_scan(self, scan, path):
+        if scan is not self._source_scan:
+            return # Superseded by a newer _load_source_list
+        try:
+            chunk = next(scan, [])
+        except Exception as e:
+            self._source_scan = None
+            logger.error(f"Failed to load source list: {e}")
+            self.statusBar().showMessage(f"Error loading files: {e}", 5000)
+            return
+        self._source_scan_rows.extend(chunk)
+        self.source_files_model.append_paths([row[2] for row in chunk])
+        if len(chunk) < SOURCE_SCAN_CHUNK: # Only the last chunk comes up short
+            self._source_scan = None
+            rows = self._source_scan_rows
+            rows.sort()
+            self.source_files_model.reorder(row[2] for row in rows)
+            self.factory_paperwork_dir_label.setText(f"Source ({len(rows)} items): {path}")
+            self._select_source_paths(self._select_after_scan)
+            self._select_after_scan = []
+            return
+        self.factory_paperwork_dir_label.setText(f"Source (scanning, {len(self._source_scan_rows)} items): {path}")
+        # Let the event loop paint and handle input before the next chunk
+        QTimer.singleShot(0, partial(self._pump_source_scan, scan, path))
 
     def _reconcile_selected_files_list(self):
-        items_to_remove = []
-        for i in range(self.selected_files_list.count()):
-            widget = self.selected_files_list.itemWidget(self.selected_files_list.item(i))
-            if not (widget and os.path.exists(widget.full_path)):
-                items_to_remove.append(i)
-        for i in reversed(items_to_remove):
-            self.selected_files_list.takeItem(i)
+        paths = self.selected_files_model.paths()
+        present = existing_paths(paths)
+        for row in reversed(range(len(paths))):
+            if paths[row] not in present:
+                self.selected_files_model.removeRow(row)
 
     def _update_button_states(self):
-        has_source_selection = len(self.source_files_list.selectedItems()) > 0
-        has_selected_selection = len(self.selected_files_list.selectedItems()) > 0
-        has_items_to_combine = self.selected_files_list.count() > 0
+        has_source_selection = self.source_files_list.selectionModel().hasSelection()
+        has_selected_selection = self.selected_files_list.selectionModel().hasSelection()
+        has_items_to_combine = self.selected_files_model.rowCount() > 0
 
         self.btn_add_to_selection.setEnabled(has_source_selection)
         self.btn_remove_from_selection.setEnabled(has_selected_selection)
-        self.btn_combine_files.setEnabled(has_items_to_combine)
+        self.btn_combine_files.setEnabled(has_items_to_combine and not self._combining)
         self.btn_convert_pdf_to_png.setEnabled(has_source_selection)
         self.btn_convert_png_to_pdf.setEnabled(has_source_selection)
         self.btn_open_inkscape.setEnabled(has_source_selection)
         self.btn_open_gimp.setEnabled(has_source_selection)
 
     def _add_to_selected_list_handler(self):
-        selected_items = self.source_files_list.selectedItems()
-        if not selected_items: return
-
-        current_paths = {self.selected_files_list.itemWidget(self.selected_files_list.item(i)).full_path for i in range(self.selected_files_list.count())}
-        max_order = 0
-        for i in range(self.selected_files_list.count()):
-            widget = self.selected_files_list.itemWidget(self.selected_files_list.item(i))
-            if widget and widget.get_order() > max_order:
-                max_order = widget.get_order()
-
-        for item in selected_items:
-            full_path = item.data(Qt.ItemDataRole.UserRole)
-            if full_path in current_paths: continue
-            
-            filename = os.path.basename(full_path)
-            order = self._get_order_for_filename(filename)
+        selected_paths = self._selected_source_paths()
+        if not selected_paths: return
+
+        max_order = self.selected_files_model.max_order()
+
+        new_paths = [p for p in dict.fromkeys(selected_paths) if not self.selected_files_model.contains_path(p)]
+        filenames = [os.path.basename(p) for p in new_paths]
+        # One classifier pass over the whole selection
+        orders = self._keyword_classifier().orders_for([f.lower() for f in filenames])
+
+        new_rows = []
+        for full_path, filename, order in zip(new_paths, filenames, orders):
             if order == DEFAULT_ORDERING_KEYWORDS.get("other", 100):
                 max_order += 10
                 order = max_order
+            new_rows.append((order, filename, full_path))
 
-            new_item = QListWidgetItem()
-            widget = OrderableListItemWidget(filename, full_path, order)
-            widget.orderAttempted.connect(self._resort_combine_list)
-            new_item.setSizeHint(widget.sizeHint())
-            self.selected_files_list.addItem(new_item)
-            self.selected_files_list.setItemWidget(new_item, widget)
-
-        self._resort_combine_list()
+        self.selected_files_model.add_rows(new_rows)
         self._update_button_states()
 
-    def _resort_combine_list(self):
-        items_data = []
-        for i in range(self.selected_files_list.count()):
-            item = self.selected_files_list.item(i)
-            widget = self.selected_files_list.itemWidget(item)
-            items_data.append({
-                'filename': widget.filename_label.text(),
-                'full_path': widget.full_path,
-                'order': widget.get_order()
-            })
-        
-        items_data.sort(key=lambda x: x['order'])
-        
-        self.selected_files_list.clear()
-
-        for data in items_data:
-            new_item = QListWidgetItem()
-            widget = OrderableListItemWidget(data['filename'], data['full_path'], data['order'])
-            widget.orderAttempted.connect(self._resort_combine_list)
-            new_item.setSizeHint(widget.sizeHint())
-            self.selected_files_list.addItem(new_item)
-            self.selected_files_list.setItemWidget(new_item, widget)
-
-
-    def _get_order_for_filename(self, filename):
-        filename_lower = filename.lower()
-        keywords = self.config.get('ordering_keywords', DEFAULT_ORDERING_KEYWORDS)
-        for keyword, order in keywords.items():
-            if keyword in filename_lower:
-                return order
-        return keywords.get("other", 100)
+    def _keyword_classifier(self):
+        # Keywords only change through Settings, which drops the classifier, so lookups never re-scan them
+        if self._kw_classifier is None:
+            self._kw_classifier = KeywordClassifier(self.config.get('ordering_keywords', DEFAULT_ORDERING_KEYWORDS))
+        return self._kw_classifier
     
     def _remove_from_selected_list_handler(self):
-        for item in self.selected_files_list.selectedItems():
-            row = self.selected_files_list.row(item)
-            self.selected_files_list.takeItem(row)
+        rows = sorted((index.row() for index in self.selected_files_list.selectionModel().selectedRows()), reverse=True)
+        for row in rows:
+            self.selected_files_model.removeRow(row)
         self._update_button_states()
 
     def _handle_rows_moved(self, parent, start, end, destination, row):
         # After a drag-drop, re-sequence the order numbers based on visual order
-        for i in range(self.selected_files_list.count()):
-            widget = self.selected_files_list.itemWidget(self.selected_files_list.item(i))
-            if widget:
-                widget.set_order((i + 1) * 10)
+        if self.selected_files_model.repositioning:
+            return # An order edit moved the row; the orders already say where everything goes
+        self.selected_files_model.renumber()
     
-    def _update_preview(self, file_path):
+    def _update_preview(self, file_path, neighbours=()):
+        self.last_previewed_path = file_path
+        self._preview_neighbours = list(neighbours)
+        self.preview_signals.prefetch_anchor = None # Neighbours of the previous file are no longer worth rendering
+        try:
+            # One stat per visit feeds both the in-memory and the on-disk cache keys
+            self._preview_stat = os.stat(file_path) if file_path else None
+        except OSError:
+            self._preview_stat = None
         if not file_path:
+            self._preview_timer.stop()
+            self._shown_preview_key = None
             self.preview_label.setText("Select a file to preview")
             self.preview_label.setPixmap(QPixmap())
             return
 
-        if self.preview_worker and self.preview_worker.isRunning():
-            self.preview_worker.stop()
-            self.preview_worker.wait()
-
+        if self._show_cached_preview(file_path):
+            self._preview_timer.stop()
+            self._prefetch_neighbours()
+            return
+        self._shown_preview_key = None
         self.preview_label.setText("Generating preview...")
-        self.preview_worker = PreviewWorker(file_path, self.preview_label.size(), self.config['pdf_to_png_dpi'])
-        self.preview_worker.previewReady.connect(self._on_preview_generated)
-        self.preview_worker.errorOccurred.connect(self.statusBar().showMessage)
-        self.preview_worker.start()
-
-    def _on_preview_generated(self, pixmap, file_path):
-        self.preview_label.setPixmap(pixmap)
+        # Stepping through a list previews every row it passes; only render where the user settles
+        self._preview_timer.start()
+
+    def _show_cached_preview(self, file_path):
+        pixmap = QPixmap()
+        key = self._preview_cache_key(file_path, self.preview_label.size(), self.preview_label.devicePixelRatioF(), self._preview_stat)
+        if key == self._shown_preview_key:
+            return True # Reselecting the file on show (list reloads, repeat clicks) needs no repaint
+        if QPixmapCache.find(key, pixmap):
+            self.preview_label.setPixmap(pixmap)
+            self._shown_preview_key = key
+            return True
+        return False
+
+    def _render_pending_preview(self):
+        file_path = self.last_previewed_path
+        if not file_path or self._show_cached_preview(file_path):
+            return
+        size = self.preview_label.size()
+        dpr = self.preview_label.devicePixelRatioF()
+        self.preview_signals.wanted = (file_path, size, dpr)
+        self._preview_pool.start(PreviewWorker(file_path, size, self.preview_signals, self.preview_disk_cache_dir, dpr,
+                                               self._preview_stat, self._preview_renderer))
+
+    def _on_preview_generated(self, file_path, size, image):
+        pixmap = QPixmap.fromImage(image)
+        st = self._preview_stat if file_path == self.last_previewed_path else None
+        key = self._preview_cache_key(file_path, size, image.devicePixelRatio(), st)
+        QPixmapCache.insert(key, pixmap)
+        # Workers may finish out of order; only show the one for the current file and size
+        if file_path == self.last_previewed_path and size == self.preview_label.size():
+            self.preview_label.setPixmap(pixmap)
+            self._shown_preview_key = key
+            self._prefetch_neighbours()
+
+    def _prefetch_neighbours(self):
+        # Started only once the current preview is up, so they never delay it
+        neighbours, self._preview_neighbours = self._preview_neighbours, []
+        size = self.preview_label.size()
+        dpr = self.preview_label.devicePixelRatioF()
+        anchor = (self.last_previewed_path, size, dpr)
+        self.preview_signals.prefetch_anchor = anchor
+        for path in neighbours:
+            if path and file_extension(path) in PREVIEW_EXTENSIONS and not QPixmapCache.find(self._preview_cache_key(path, size, dpr), QPixmap()):
+                worker = PreviewWorker(path, size, self.preview_signals, self.preview_disk_cache_dir, dpr,
+                                       renderer=self._preview_renderer, prefetch_anchor=anchor)
+                self._preview_pool.start(worker, -1) # Behind the current preview
+    @staticmethod
+    def _preview_cache_key(file_path, size, dpr, stat=None):
+        # The mtime retires entries for files rewritten in place (conversions, overwriting drops)
+        if stat is not None:
+            mtime = stat.st_mtime
+        else:
+            try:
+                mtime = os.path.getmtime(file_path)
+            except OSError:
+                mtime = 0
+        return f"preview:{file_path}|{mtime}|{size.width()}x{size.height()}@{dpr}"
 
     def _save_toggle_config(self):
         self.config['delete_after_conversion'] = self.delete_after_conversion_checkbox.isChecked()
         self.config['delete_after_combination'] = self.delete_after_combination_checkbox.isChecked()
         self.config['open_in_libreoffice'] = self.open_in_libreoffice_checkbox.isChecked()
-        save_config(self.config)
+        self._save_config_later()
+
+    def _save_config_later(self):
+        self._config_dirty = True
+        self._config_save_timer.start()
 
-    def _on_resize_event(self, event):
-        super().resizeEvent(event)
+    def _flush_config(self):
+        self._config_save_timer.stop()
+        if self._config_dirty:
+            save_config(self.config)
+            self._config_dirty = False
+
+    def eventFilter(self, obj, event):
+        if obj is self.preview_label and event.type() == QEvent.Type.Resize and self.last_previewed_path:
+            # A drag fires many resizes; render once it settles
+            self._preview_timer.start()
+        return super().eventFilter(obj, event)
 
     def _perform_pdf_combination(self):
-        if self.selected_files_list.count() == 0:
+        ordered_files = self.selected_files_model.paths()
+        if not ordered_files or self._combining:
+            return
+        # Check every input up front rather than failing partway through the combine
+        present = existing_paths(ordered_files)
+        missing = [path for path in ordered_files if path not in present]
+        if missing:
+            box = QMessageBox(QMessageBox.Icon.Warning, "Files Missing",
+                              f"{len(missing)} file(s) in the combine list no longer exist. Nothing was combined.",
+                              QMessageBox.StandardButton.Ok, self)
+            box.setDetailedText("\n".join(missing))
+            box.exec()
+            self._reconcile_selected_files_list() # Drop them so the next attempt can go ahead
+            self._update_button_states()
             return
 
-        ordered_files = [self.selected_files_list.itemWidget(self.selected_files_list.item(i)).full_path for i in range(self.selected_files_list.count())]
         
         default_dir = os.path.dirname(ordered_files[0]) if ordered_files else self.config.get('factory_paperwork_dir')
         output_path, _ = QFileDialog.getSaveFileName(self, "Save Combined PDF", os.path.join(default_dir or '', "combined.pdf"), "PDF Files (*.pdf)")
 
         if not output_path: return
-            
-        writer = PdfWriter()
+
         progress = QProgressDialog("Combining files...", "Cancel", 0, len(ordered_files), self)
         progress.setWindowModality(Qt.WindowModality.WindowModal)
+        canceled = threading.Event()
+        progress.canceled.connect(canceled.set)
         progress.show()
+        # Cancel hides the dialog at once, but the worker only stops between files; a second
+        # combine started meanwhile would share, and then lose, the pool the first one tears down
+        self._combining = True
+        self._update_button_states()
 
-        try:
-            for i, f_path in enumerate(ordered_files):
-                progress.setValue(i)
-                if progress.wasCanceled(): break
-                
-                reader = None
-                pdf_stream = None
-                try:
-                    if f_path.lower().endswith(('.png', '.jpg', '.jpeg')):
-                        with Image.open(f_path) as img:
-                            if img.mode == 'RGBA':
-                                bg = Image.new('RGB', img.size, (255, 255, 255))
-                                bg.paste(img, mask=img.split()[3])
-                                img = bg
-                            
-                            pdf_stream = io.BytesIO()
-                            img.save(pdf_stream, "PDF", resolution=100.0)
-                            pdf_stream.seek(0)
-                            reader = PdfReader(pdf_stream)
-
-                    elif f_path.lower().endswith('.pdf'):
-                        reader = PdfReader(f_path)
-                    
-                    if reader:
-                        for page in reader.pages:
-                            if page.mediabox.width > page.mediabox.height:
-                                page.rotate(90)
-
-                            target_page = writer.add_blank_page(width=A4_WIDTH_PT, height=A4_HEIGHT_PT)
-                            scale = min(A4_WIDTH_PT / page.mediabox.width, A4_HEIGHT_PT / page.mediabox.height)
-                            tx = (A4_WIDTH_PT - page.mediabox.width * scale) / 2
-                            ty = (A4_HEIGHT_PT - page.mediabox.height * scale) / 2
-                            transform = Transformation().scale(scale).translate(tx, ty)
-                            target_page.merge_transformed_page(page, transform)
-                finally:
-                    if reader and hasattr(reader, 'stream') and reader.stream:
-                        reader.stream.close() 
-                    if pdf_stream:
-                        pdf_stream.close()
-            
-            if not progress.wasCanceled():
-                with open(output_path, "wb") as fp:
-                    writer.write(fp)
-                QMessageBox.information(self, "Success", "Files combined successfully.")
-                if self.config.get('delete_after_combination'):
-                    for f in ordered_files: os.remove(f)
-                    self._load_all_lists()
-                
-                if self.config.get('open_in_libreoffice', False):
-                    libreoffice_path = self.config.get('libreoffice_draw_path')
-                    if libreoffice_path and os.path.exists(libreoffice_path):
-                        subprocess.Popen([libreoffice_path, output_path])
-                    else:
-                        QMessageBox.warning(self, "LibreOffice Not Found", "Path to LibreOffice Draw is not set or invalid in settings.")
+        pool = self._combine_workers() if len(ordered_files) >= COMBINE_POOL_MIN_FILES else None
+        signals = ConversionSignals(self)
+        signals.progress.connect(progress.setValue)
+        signals.finished.connect(partial(self._on_combination_finished, signals, progress, ordered_files, output_path, pool))
+        signals.errorOccurred.connect(partial(self._on_combination_failed, signals, progress, pool))
+        # The GUI thread only drives the dialog; the worker reports progress per file
+        work = partial(combine_files, ordered_files, output_path, pool, canceled)
+        QThreadPool.globalInstance().start(ConversionWorker(work, signals))
+
+    def _on_combination_finished(self, signals, progress, ordered_files, output_path, pool, message):
+        progress.close()
+        signals.deleteLater()
+        self._combining = False
+        self._update_button_states()
+        if not message: # Canceled
+            if pool is not None:
+                # Unfinished tasks would hold up the next combine on the same pool
+                self._close_combine_workers(terminate=True)
+            return
 
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"An error occurred during PDF combination: {e}")
-            logger.error(f"Error in PDF combination: {e}", exc_info=True)
-        finally:
-            writer.close()
-            progress.close()
+        QMessageBox.information(self, "Success", message)
+        if self.config.get('delete_after_combination'):
+            self._delete_originals(ordered_files, "Combined, but", self._load_all_lists)
+
+        if self.config.get('open_in_libreoffice', False):
+            libreoffice_path = self.config.get('libreoffice_draw_path')
+            if self._exec_exists['libreoffice_draw_path']:
+                spawn_detached(libreoffice_path, output_path)
+            else:
+                QMessageBox.warning(self, "LibreOffice Not Found", "Path to LibreOffice Draw is not set or invalid in settings.")
+
+    def _on_combination_failed(self, signals, progress, pool, message):
+        progress.close()
+        signals.deleteLater()
+        self._combining = False
+        if pool is not None:
+            # A worker may have died, and a broken pool refuses all further work
+            self._close_combine_workers(terminate=True)
+        self._update_button_states()
+        QMessageBox.critical(self, "Error", f"An error occurred during PDF combination: {message}")
+
+    def _combine_workers(self):
+        # Kept for the session: spawning a worker re-imports this module, which dwarfs one file's work
+        if self._combine_pool is None:
+            self._combine_pool = ProcessPoolExecutor(min(os.cpu_count() or 1, COMBINE_POOL_MAX_WORKERS), mp_context=MP_CONTEXT)
+        return self._combine_pool
+
+    def _close_combine_workers(self, terminate=False):
+        if self._combine_pool is not None:
+            # With terminate, queued tasks are dropped and the pool is let go without waiting;
+            # a task still running finishes one file in the background before its worker exits
+            self._combine_pool.shutdown(wait=not terminate, cancel_futures=terminate)
+            self._combine_pool = None
 
     def _open_selected_pdf_with_inkscape(self):
-        selected_items = self.source_files_list.selectedItems()
-        if not selected_items:
+        selected_paths = self._selected_source_paths()
+        if not selected_paths:
             QMessageBox.warning(self, "Selection Error", "No PDF file selected.")
             return
 
-        file_path = selected_items[0].data(Qt.ItemDataRole.UserRole)
-        if not file_path.lower().endswith('.pdf'):
+        # Every selected PDF goes to one Inkscape launch rather than one cold start each
+        file_paths = [path for path in selected_paths if file_extension(path) == '.pdf']
+        if not file_paths:
             QMessageBox.warning(self, "File Type Error", "Selected file is not a PDF.")
             return
 
         inkscape_path = self.config.get('inkscape_path')
-        if not inkscape_path or not os.path.exists(inkscape_path):
+        if not self._exec_exists['inkscape_path']:
             QMessageBox.critical(self, "Configuration Error", "Inkscape path is not configured or invalid. Please set it in Settings.")
             return
         
         try:
-            subprocess.Popen([inkscape_path, file_path])
+            spawn_detached(inkscape_path, *file_paths)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to open with Inkscape: {e}")
 
     def _open_selected_png_with_gimp(self):
-        selected_items = self.source_files_list.selectedItems()
-        if not selected_items:
+        selected_paths = self._selected_source_paths()
+        if not selected_paths:
             QMessageBox.warning(self, "Selection Error", "No image file selected.")
             return
 
-        file_path = selected_items[0].data(Qt.ItemDataRole.UserRole)
-        if not file_path.lower().endswith(('.png', '.jpg', '.jpeg')):
+        file_paths = [path for path in selected_paths if file_extension(path) in IMAGE_EXTENSIONS]
+        if not file_paths:
             QMessageBox.warning(self, "File Type Error", "Selected file is not a supported image for GIMP.")
             return
 
         gimp_path = self.config.get('gimp_path')
-        if not gimp_path or not os.path.exists(gimp_path):
+        if not self._exec_exists['gimp_path']:
             QMessageBox.critical(self, "Configuration Error", "GIMP path is not configured or invalid. Please set it in Settings.")
             return
         
         try:
-            subprocess.Popen([gimp_path, file_path])
+            spawn_detached(gimp_path, *file_paths)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to open with GIMP: {e}")
 
     def _convert_selected_pdf_to_png(self):
-        selected_items = self.source_files_list.selectedItems()
-        if not selected_items: return
+        selected_paths = self._selected_source_paths()
+        if not selected_paths: return
         
-        pdf_path = selected_items[0].data(Qt.ItemDataRole.UserRole)
-        if not pdf_path.lower().endswith('.pdf'):
+        pdf_path = selected_paths[0]
+        if file_extension(pdf_path) != '.pdf':
             QMessageBox.warning(self, "File Type Error", "Please select a PDF file.")
             return
 
@@ -730,23 +1820,16 @@ class PDFToolApp(QMainWindow):
             if QMessageBox.question(self, "File Exists", "Output PNG already exists. Overwrite?", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No) == QMessageBox.StandardButton.No:
                 return
         
-        try:
-            doc = fitz.open(pdf_path)
-            page = doc.load_page(0)
-            pix = page.get_pixmap(dpi=self.config.get('pdf_to_png_dpi', 150))
-            pix.save(output_path)
-            QMessageBox.information(self, "Success", "PDF converted to PNG.")
-            if self.config.get('delete_after_conversion'):
-                os.remove(pdf_path)
-            self._load_source_list()
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to convert PDF: {e}")
+        self._start_conversion(
+            "Converting PDF to PNG...", 1,
+            partial(pdf_first_page_to_png, pdf_path, output_path, self.config.get('pdf_to_png_dpi', 150)),
+            [pdf_path], "Failed to convert PDF")
 
     def _convert_selected_png_to_pdf(self):
-        selected_items = self.source_files_list.selectedItems()
-        if not selected_items: return
+        selected_paths = self._selected_source_paths()
+        if not selected_paths: return
         
-        image_paths = [item.data(Qt.ItemDataRole.UserRole) for item in selected_items if item.data(Qt.ItemDataRole.UserRole).lower().endswith(('.png', '.jpg', '.jpeg'))]
+        image_paths = [path for path in selected_paths if file_extension(path) in IMAGE_EXTENSIONS]
         if not image_paths:
             QMessageBox.warning(self, "Selection Error", "No valid image files selected.")
             return
@@ -756,40 +1839,110 @@ class PDFToolApp(QMainWindow):
             if QMessageBox.question(self, "File Exists", "Output PDF already exists. Overwrite?", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No) == QMessageBox.StandardButton.No:
                 return
 
-        writer = PdfWriter()
+        # Borrow the combine pool, unless a canceled combine may still tear it down
+        use_pool = len(image_paths) >= COMBINE_POOL_MIN_FILES and not self._combining
+        pool = self._combine_workers() if use_pool else None
+        self._start_conversion(
+            "Converting images to PDF...", len(image_paths),
+            partial(images_to_pdf, image_paths, output_path, pool),
+            image_paths, "Failed to convert images", pool)
+
+    def _start_conversion(self, label, total, work, input_paths, error_title, pool=None):
+        # The window-modal dialog also keeps a second conversion from starting meanwhile
+        progress = QProgressDialog(label, "", 0, total, self)
+        progress.setCancelButton(None) # Conversions run to completion
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.show()
+        signals = ConversionSignals(self)
+        signals.progress.connect(progress.setValue)
+        signals.finished.connect(partial(self._on_conversion_finished, signals, progress, input_paths))
+        signals.errorOccurred.connect(partial(self._on_conversion_failed, signals, progress, error_title, pool))
+        QThreadPool.globalInstance().start(ConversionWorker(work, signals))
+
+    def _on_conversion_finished(self, signals, progress, input_paths, message):
+        progress.close()
+        signals.deleteLater()
+        QMessageBox.information(self, "Success", message)
+        self._load_source_list() # Show the new output now; the deletes below reload again when done
+        if self.config.get('delete_after_conversion'):
+            self._delete_originals(input_paths, "Converted, but", self._load_source_list)
+
+    def _delete_originals(self, paths, outcome, on_done):
+        """Delete paths on the thread pool, then call on_done; one warning lists every file left behind."""
+        signals = ConversionSignals(self)
+        # delete_files reports failures in its result, so errorOccurred only carries the unexpected
+        signals.finished.connect(partial(self._on_originals_deleted, signals, outcome, on_done))
+        signals.errorOccurred.connect(partial(self._on_originals_deleted, signals, outcome, on_done))
+        QThreadPool.globalInstance().start(ConversionWorker(partial(delete_files, paths), signals))
+
+    def _on_originals_deleted(self, signals, outcome, on_done, errors):
+        signals.deleteLater()
+        on_done()
+        if errors:
+            failed = errors.count("\n") + 1
+            box = QMessageBox(QMessageBox.Icon.Warning, "Delete Failed",
+                              f"{outcome} {failed} original(s) could not be deleted.",
+                              QMessageBox.StandardButton.Ok, self)
+            box.setDetailedText(errors)
+            box.exec()
+
+    def _on_conversion_failed(self, signals, progress, error_title, pool, message):
+        progress.close()
+        signals.deleteLater()
+        if pool is not None and not self._combining:
+            self._close_combine_workers(terminate=True) # It may be broken; the next user starts a fresh one
+        QMessageBox.critical(self, "Error", f"{error_title}: {message}")
+
+    def _warm_blender_import(self):
+        threading.Thread(target=self._import_blender, daemon=True).start()
+
+    @staticmethod
+    def _import_blender():
+        # A click during the warm-up waits on the module's import lock rather than seeing it half-initialised
         try:
-            for img_path in image_paths:
-                with Image.open(img_path) as img:
-                    if img.mode == 'RGBA': img = img.convert('RGB')
-                    with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-                        img.save(tmp.name, "PDF")
-                        reader = PdfReader(tmp.name)
-                        writer.add_page(reader.pages[0])
-                        reader.stream.close()
-                    os.remove(tmp.name)
-            
-            with open(output_path, "wb") as f_out:
-                writer.write(f_out)
-            QMessageBox.information(self, "Success", f"{len(image_paths)} image(s) converted to PDF.")
-            if self.config.get('delete_after_conversion'):
-                for path in image_paths: os.remove(path)
-            self._load_source_list()
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to convert images: {e}")
-        finally:
-            writer.close()
+            return importlib.import_module('image_blender_gui')
+        except ImportError as e:
+            logger.error(f"Failed to import image_blender_gui: {e}")
+            return None
 
     def _open_image_blender(self):
-        if ImageBlenderWindow:
-            if not self.image_blender_window:
-                self.image_blender_window = ImageBlenderWindow()
-            self.image_blender_window.show()
+        if not self.image_blender_window:
+            module = self._import_blender() # Already in sys.modules once the warm-up has finished
+            if module is None:
+                QMessageBox.critical(self, "Error", "The Image Blender could not be loaded. See the log for details.")
+                return
+            self.image_blender_window = module.ImageBlenderWindow()
+        self.image_blender_window.show()
             
+    def _close_idle_documents(self):
+        document_cache.close_idle()
+        if self._preview_renderer is not None:
+            self._preview_renderer.close_idle()
+
+    def _start_preview_renderer(self):
+        try:
+            self._preview_renderer = PreviewRenderer()
+        except OSError as e:
+            logger.warning(f"Preview renderer process unavailable, rendering in-process: {e}")
+
     def closeEvent(self, event):
         if self.image_blender_window: self.image_blender_window.close()
-        save_config(self.config)
+        self._close_combine_workers()
+        self._preview_pool.clear() # Queued previews; running ones end with the renderer
+        if self._preview_renderer is not None:
+            self._preview_renderer.close()
+            self._preview_renderer = None
+        document_cache.close_all()
+        self._flush_config()
         super().closeEvent(event)
 
+    def changeEvent(self, event):
+        if event.type() == QEvent.Type.WindowStateChange and self.isMinimized():
+            # Backgrounded: hand MuPDF's render cache back to the OS, unless a worker is using
+            # a document right now; waiting for it would freeze the window mid-minimise
+            document_cache.shrink_store(blocking=False)
+        super().changeEvent(event)
+
     def dragEnterEvent(self, event):
         if event.mimeData().hasUrls():
             event.acceptProposedAction()
@@ -800,8 +1953,58 @@ class PDFToolApp(QMainWindow):
         urls = [url.toLocalFile() for url in event.mimeData().urls()]
         self._add_files_from_paths(urls)
 
+    def _add_files_from_paths(self, paths):
+        """Copy dropped files into the source directory on the thread pool."""
+        dest_dir = self.config.get('factory_paperwork_dir')
+        if not dest_dir or not os.path.isdir(dest_dir):
+            QMessageBox.warning(self, "No Source Directory", "Set a source directory before dropping files.")
+            return
+        pairs = [(src, os.path.join(dest_dir, os.path.basename(src))) for src in paths
+                 if file_extension(src) in SOURCE_EXTENSIONS and os.path.isfile(src)]
+        # A big drop checks its destinations with one listing of the source directory, not a stat each
+        taken = existing_paths([dst for _, dst in pairs])
+        plan, conflicts = [], []
+        for src, dst in pairs:
+            if dst not in taken:
+                plan.append((src, dst))
+            elif not os.path.samefile(src, dst): # Dropping a file from the source directory itself is a no-op
+                conflicts.append((src, dst))
+        skipped = len(conflicts)
+        if conflicts:
+            # One question for the whole drop rather than a prompt per file
+            reply = QMessageBox.question(
+                self, "Files Exist",
+                f"{len(conflicts)} dropped file(s) already exist in the source directory. Overwrite them?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No | QMessageBox.StandardButton.Cancel)
+            if reply == QMessageBox.StandardButton.Cancel:
+                return
+            if reply == QMessageBox.StandardButton.Yes:
+                plan.extend(conflicts)
+                skipped = 0
+        if not plan:
+            self.statusBar().showMessage("Nothing to copy from the drop.", 5000)
+            return
+        # One job for the whole drop, so the list reloads and the status reports once
+        self.statusBar().showMessage(f"Copying {len(plan)} file(s)...")
+        signals = ConversionSignals(self)
+        signals.finished.connect(partial(self._on_files_copied, signals, [dst for _, dst in plan]))
+        signals.errorOccurred.connect(partial(self._on_files_copy_failed, signals))
+        QThreadPool.globalInstance().start(ConversionWorker(partial(copy_files, plan, skipped), signals))
+
+    def _on_files_copied(self, signals, copied_paths, message):
+        signals.deleteLater()
+        self.statusBar().showMessage(message, 5000)
+        self._select_after_scan = copied_paths # Highlight the new files once the list is rebuilt
+        self._load_source_list()
+
+    def _on_files_copy_failed(self, signals, message):
+        signals.deleteLater()
+        self._load_source_list() # Show whatever was copied before the failure
+        QMessageBox.critical(self, "Error", f"Failed to copy dropped files: {message}")
+
 # MAIN EXECUTION BLOCK
 if __name__ == "__main__":
+    multiprocessing.freeze_support() # Combine workers in a frozen Windows build
     app = QApplication(sys.argv)
     window = PDFToolApp()
     window.show()
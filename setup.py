@@ -0,0 +1,12 @@
+import sys
+
+from setuptools import Extension, setup
+
+# Builds the optional SSE2 Overlay kernel used by blend_ops.py.
+# The app runs without it; build in place with: python setup.py build_ext --inplace
+extra_compile_args = ["/O2"] if sys.platform == "win32" else ["-O3"]
+
+setup(
+    name="overlay_sse2",
+    ext_modules=[Extension("overlay_sse2", ["overlay_sse2.c"], extra_compile_args=extra_compile_args)],
+)
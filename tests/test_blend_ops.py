@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from blend_ops import blend_normal
+
+# blend_normal rounds through INT_MULT and a per-pixel divide, Pillow through fixed-point
+# coefficients; the two disagree by a few levels where the resulting alpha is low
+NORMAL_COLOUR_TOLERANCE = 3
+
+
+def _random_layers(seed, size=(64, 64)):
+    rng = np.random.default_rng(seed)
+    base = rng.integers(0, 256, size + (4,), dtype=np.uint8)
+    over = rng.integers(0, 256, size + (4,), dtype=np.uint8)
+    # Make sure the transparent and opaque edge cases all occur
+    base[::7, :, 3] = 0
+    over[::5, :, 3] = 0
+    over[::11, :, 3] = 255
+    return base, over
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_blend_normal_matches_alpha_composite(seed):
+    base, over = _random_layers(seed)
+    expected = np.asarray(Image.alpha_composite(Image.fromarray(base, "RGBA"), Image.fromarray(over, "RGBA")))
+    result = blend_normal(base, over, np.empty_like(base))
+
+    diff = np.abs(expected.astype(np.int16) - result)
+    assert diff[:, :, 3].max() == 0
+    assert diff[:, :, :3].max() <= NORMAL_COLOUR_TOLERANCE
+
+
+def test_blend_normal_exact_cases():
+    base, over = _random_layers(99)
+    result = blend_normal(base, over, np.empty_like(base))
+
+    hidden = over[:, :, 3] == 0
+    assert np.array_equal(result[hidden], base[hidden]) # Including a fully transparent result
+    opaque = over[:, :, 3] == 255
+    assert np.array_equal(result[opaque], over[opaque])
+
+
+def test_blend_normal_accepts_non_contiguous_inputs():
+    base, over = _random_layers(3, size=(32, 64))
+    result = blend_normal(base[:, ::2], over[:, ::2], np.empty((32, 32, 4), dtype=np.uint8))
+    assert np.array_equal(result, blend_normal(base[:, ::2].copy(), over[:, ::2].copy(), np.empty((32, 32, 4), dtype=np.uint8)))
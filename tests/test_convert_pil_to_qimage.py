@@ -0,0 +1,66 @@
+import gc
+import weakref
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from image_blender_gui import convert_pil_to_qimage
+
+
+def _churn():
+    # Reuse freed memory so a dangling QImage would read garbage rather than stale pixels
+    gc.collect()
+    return [bytes([0x5A]) * 4096 for _ in range(256)]
+
+
+@pytest.mark.parametrize("mode, colour, expected", [
+    ("L", 200, (200, 200, 200, 255)),
+    ("RGB", (10, 120, 250), (10, 120, 250, 255)),
+    ("RGBA", (10, 120, 250, 255), (10, 120, 250, 255)),
+    ("P", 3, None), # Falls back to RGBA
+])
+def test_qimage_outlives_and_ignores_source(mode, colour, expected):
+    src = Image.new(mode, (17, 9), colour)
+    if mode == "P":
+        src.putpalette([0] * 9 + [30, 60, 90] + [0] * 756)
+        expected = (30, 60, 90, 255)
+    qimage = convert_pil_to_qimage(src)
+
+    # Change and then drop the source; the QImage must keep showing the original pixels
+    src.paste(0, (0, 0) + src.size)
+    del src
+    garbage = _churn()
+
+    for x, y in ((0, 0), (16, 8), (8, 4)):
+        assert qimage.pixelColor(x, y).getRgb() == expected
+    del garbage
+
+
+def test_qimage_shares_and_holds_its_buffer():
+    src = Image.new("RGBA", (8, 8), (255, 0, 0, 255))
+    qimage = convert_pil_to_qimage(src)
+    del src
+
+    # The attribute sticks on the Shiboken wrapper and is the memory QImage paints from
+    buf = qimage._buf
+    buf[0, 0] = (0, 0, 255, 255)
+    assert qimage.pixelColor(0, 0).getRgb() == (0, 0, 255, 255)
+
+    ref = weakref.ref(buf)
+    del buf
+    _churn()
+    assert ref() is not None # Only qimage refers to it now
+    assert qimage.pixelColor(7, 7).getRgb() == (255, 0, 0, 255)
+
+    del qimage
+    gc.collect()
+    assert ref() is None
+
+
+def test_premultiplied_alpha_round_trips():
+    src = Image.new("RGBA", (4, 4), (200, 100, 50, 128))
+    qimage = convert_pil_to_qimage(src)
+    r, g, b, a = qimage.pixelColor(1, 1).getRgb()
+    assert a == 128
+    assert max(abs(r - 200), abs(g - 100), abs(b - 50)) <= 2 # Premultiplying rounds each channel once
@@ -0,0 +1,53 @@
+import os
+
+import numpy as np
+import pytest
+from PIL import Image
+from PySide6.QtWidgets import QApplication
+
+from image_blender_gui import ImageBlenderWindow
+
+
+@pytest.fixture(scope="module")
+def window():
+    app = QApplication.instance() or QApplication([])
+    dialog = ImageBlenderWindow()
+    yield dialog
+    dialog.close()
+    del app
+
+
+def _load(window, base, blend):
+    window._on_image_loaded(1, base, "")
+    window._on_image_loaded(2, blend, "")
+
+
+@pytest.mark.parametrize("blend_size", [(39, 30), (40, 29), (41, 31)])
+@pytest.mark.parametrize("mode", ["Multiply", "Darken", "Normal"])
+def test_off_by_one_layer_keeps_its_edge(window, mode, blend_size):
+    colour = (200, 120, 40, 255)
+    _load(window, Image.new("RGBA", (40, 30), (255, 255, 255, 255)), Image.new("RGBA", blend_size, colour))
+
+    result = np.asarray(window._compute_blend(mode))
+
+    assert result.shape == (30, 40, 4)
+    # Over white, each of these modes gives back the blend layer unchanged, right up to the edges
+    assert (result == colour).all()
+
+
+def test_pdf_layer_rereads_an_edited_file(window, tmp_path):
+    fitz = pytest.importorskip("fitz")
+    path = str(tmp_path / "layer.pdf")
+
+    def write(width, height, mtime):
+        with fitz.open() as doc:
+            doc.new_page(width=width, height=height)
+            doc.save(path)
+        os.utime(path, (mtime, mtime))
+
+    write(100, 50, 1_000_000)
+    assert window._load_and_convert_image(path).size == (100, 50)
+    assert window._load_and_convert_image(path).size == (100, 50) # Served from the open document
+    write(60, 80, 1_000_100)
+    assert window._load_and_convert_image(path).size == (60, 80)
+    assert len(window._pdf_cache) == 1
@@ -0,0 +1,170 @@
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import fitz
+import pytest
+from PIL import Image
+
+import pdf_manager
+from pdf_manager import (
+    A4_HEIGHT_PT, A4_WIDTH_PT, EXISTS_SCAN_MIN_PATHS, MP_CONTEXT, KeywordClassifier,
+    atomic_output, bounded_imap, combine_files, existing_paths
+)
+
+
+# Pool tasks; module level so spawned workers can import them
+def _exit_on_two(x):
+    if x == 2:
+        os._exit(3)
+    return x
+
+def _slow_identity(x):
+    time.sleep(0.5)
+    return x
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with ProcessPoolExecutor(2, mp_context=MP_CONTEXT) as executor:
+        yield executor
+
+
+def _pdf(path, text, width=300, height=400):
+    with fitz.open() as doc:
+        doc.new_page(width=width, height=height).insert_text((20, 40), text)
+        doc.save(path)
+    return str(path)
+
+
+def _page_texts(path):
+    with fitz.open(path) as doc:
+        return [(page.get_text().strip(), round(page.rect.width), round(page.rect.height)) for page in doc]
+
+
+def test_classifier_first_keyword_wins():
+    classifier = KeywordClassifier({"plan": 20, "drawing": 10, "other": 100})
+    assert classifier.order_for("site plan drawing.pdf") == 20 # Dict order, not position in the name
+    assert classifier.order_for("drawing 1.pdf") == 10
+    assert classifier.order_for("invoice.pdf") == 100
+
+
+def test_classifier_batch_matches_single():
+    classifier = KeywordClassifier(pdf_manager.DEFAULT_ORDERING_KEYWORDS)
+    names = ["a_plan.pdf", "photo.png", "x.pdf", "a_plan.pdf", "detail-report.pdf"]
+    assert classifier.orders_for(names) == [20, 70, 100, 20, 30]
+    assert classifier.orders_for(names) == [KeywordClassifier(pdf_manager.DEFAULT_ORDERING_KEYWORDS).order_for(n) for n in names]
+
+
+def test_classifier_default_without_other():
+    assert KeywordClassifier({"plan": 5}).order_for("misc.pdf") == pdf_manager.DEFAULT_ORDERING_KEYWORDS["other"]
+
+
+@pytest.mark.parametrize("count", [EXISTS_SCAN_MIN_PATHS - 1, EXISTS_SCAN_MIN_PATHS * 2])
+def test_existing_paths(tmp_path, count):
+    present = [tmp_path / f"f{i}.pdf" for i in range(count)]
+    for path in present:
+        path.write_bytes(b"")
+    missing = [str(tmp_path / f"gone{i}.pdf") for i in range(3)] + [str(tmp_path / "no_dir" / "x.pdf")]
+    assert existing_paths([str(p) for p in present] + missing) == {str(p) for p in present}
+
+
+def test_atomic_output_replaces_on_success(tmp_path):
+    target = tmp_path / "out.pdf"
+    target.write_bytes(b"old")
+    with atomic_output(str(target)) as tmp:
+        assert os.path.dirname(tmp) == str(tmp_path) and tmp.endswith(".pdf")
+        with open(tmp, "wb") as f:
+            f.write(b"new")
+    assert target.read_bytes() == b"new"
+    assert os.listdir(tmp_path) == ["out.pdf"]
+
+
+def test_atomic_output_cleans_up_on_error(tmp_path):
+    target = tmp_path / "out.pdf"
+    target.write_bytes(b"old")
+    with pytest.raises(RuntimeError):
+        with atomic_output(str(target)) as tmp:
+            with open(tmp, "wb") as f:
+                f.write(b"half")
+            raise RuntimeError("writer failed")
+    assert target.read_bytes() == b"old"
+    assert os.listdir(tmp_path) == ["out.pdf"]
+
+
+def _inputs(tmp_path):
+    png = tmp_path / "photo.png"
+    Image.new("RGB", (80, 40), (200, 30, 30)).save(png) # Landscape, so it is turned onto a portrait page
+    return [
+        _pdf(tmp_path / "one.pdf", "first"),
+        str(png),
+        _pdf(tmp_path / "two.pdf", "second", width=800, height=300),
+        _pdf(tmp_path / "a4.pdf", "third", width=A4_WIDTH_PT, height=A4_HEIGHT_PT),
+    ]
+
+
+@pytest.mark.parametrize("use_pool", [False, True])
+def test_combine_order_and_page_size(tmp_path, pool, use_pool):
+    output = str(tmp_path / "combined.pdf")
+    progress = []
+    message = combine_files(_inputs(tmp_path), output, pool if use_pool else None, threading.Event(), progress.append)
+
+    assert message == "Files combined successfully."
+    assert progress == [1, 2, 3, 4]
+    pages = _page_texts(output)
+    assert [text for text, _, _ in pages] == ["first", "", "second", "third"]
+    assert all((w, h) == (round(A4_WIDTH_PT), round(A4_HEIGHT_PT)) for _, w, h in pages)
+
+
+def test_combine_canceled_writes_nothing(tmp_path, pool):
+    canceled = threading.Event()
+    canceled.set()
+    output = tmp_path / "combined.pdf"
+    assert combine_files(_inputs(tmp_path), str(output), pool, canceled, lambda i: None) == ""
+    assert not output.exists()
+
+
+def test_combine_fails_when_a_worker_task_fails(tmp_path, pool):
+    inputs = _inputs(tmp_path)
+    broken = tmp_path / "broken.pdf"
+    broken.write_bytes(b"not a pdf")
+    output = tmp_path / "combined.pdf"
+    with pytest.raises(Exception):
+        combine_files(inputs[:2] + [str(broken)] + inputs[2:], str(output), pool, threading.Event(), lambda i: None)
+    assert not output.exists()
+    assert sorted(os.listdir(tmp_path)) == sorted(os.path.basename(p) for p in inputs + [str(broken)])
+
+
+def test_bounded_imap_raises_when_a_worker_dies():
+    with ProcessPoolExecutor(2, mp_context=MP_CONTEXT) as executor:
+        results = []
+        with pytest.raises(BrokenProcessPool):
+            for value in bounded_imap(executor, _exit_on_two, range(6), ahead=2):
+                results.append(value)
+        assert results == [0, 1]
+
+
+def test_bounded_imap_stops_on_cancel(pool):
+    canceled = threading.Event()
+    threading.Timer(0.2, canceled.set).start()
+    start = time.monotonic()
+    assert list(bounded_imap(pool, _slow_identity, range(50), ahead=4, canceled=canceled)) == []
+    assert time.monotonic() - start < 5
+
+
+def test_document_cache_reuses_then_closes_idle(tmp_path):
+    cache = pdf_manager.DocumentCache()
+    path = _pdf(tmp_path / "doc.pdf", "x")
+    with cache.use(path) as first:
+        pass
+    with cache.use(path) as second:
+        assert second is first
+    cache.close_idle(max_idle=60)
+    assert not first.is_closed
+    cache.close_idle(max_idle=0)
+    assert first.is_closed
+    with cache.use(path) as third:
+        assert third is not first
+    cache.close_all()
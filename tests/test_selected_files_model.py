@@ -0,0 +1,70 @@
+from functools import partial
+from types import SimpleNamespace
+
+import pytest
+from PySide6.QtCore import QModelIndex
+from PySide6.QtWidgets import QApplication, QSpinBox
+
+from pdf_manager import PDFToolApp, SelectedFileDelegate, SelectedFilesModel
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def model(app):
+    model = SelectedFilesModel()
+    model.add_rows([(10, "cover.pdf", "/d/cover.pdf"), (20, "b.pdf", "/d/b.pdf"),
+                    (35, "c.pdf", "/d/c.pdf"), (100, "d.pdf", "/d/d.pdf")])
+    # Wired the way PDFToolApp wires it
+    model.rowsMoved.connect(partial(PDFToolApp._handle_rows_moved, SimpleNamespace(selected_files_model=model)))
+    return model
+
+
+def _rows(model):
+    return [[model.index(i).data(SelectedFilesModel.OrderRole), model.index(i).data(SelectedFilesModel.NameRole)]
+            for i in range(model.rowCount())]
+
+
+def _edit_order(model, row, value):
+    editor = QSpinBox()
+    editor.setRange(1, 9999)
+    editor.setValue(value)
+    SelectedFileDelegate().setModelData(editor, model, model.index(row))
+
+
+def test_add_rows_sorts_by_order_then_name(app):
+    model = SelectedFilesModel()
+    model.add_rows([(20, "b.pdf", "/b"), (10, "z.pdf", "/z")])
+    model.add_rows([(10, "a.pdf", "/a"), (30, "c.pdf", "/c")])
+    assert _rows(model) == [[10, "a.pdf"], [10, "z.pdf"], [20, "b.pdf"], [30, "c.pdf"]]
+    assert model.max_order() == 30
+    assert model.contains_path("/a") and not model.contains_path("/x")
+
+
+def test_order_edit_moves_row_and_keeps_other_orders(model):
+    _edit_order(model, 3, 5)
+    assert _rows(model) == [[5, "d.pdf"], [10, "cover.pdf"], [20, "b.pdf"], [35, "c.pdf"]]
+
+    _edit_order(model, 0, 50)
+    assert _rows(model) == [[10, "cover.pdf"], [20, "b.pdf"], [35, "c.pdf"], [50, "d.pdf"]]
+
+
+def test_order_edit_in_place(model):
+    _edit_order(model, 2, 30)
+    assert _rows(model) == [[10, "cover.pdf"], [20, "b.pdf"], [30, "c.pdf"], [100, "d.pdf"]]
+
+
+def test_drag_renumbers(model):
+    # What QListView's InternalMove does when the last row is dropped first
+    assert model.moveRows(QModelIndex(), 3, 1, QModelIndex(), 0)
+    assert _rows(model) == [[10, "d.pdf"], [20, "cover.pdf"], [30, "b.pdf"], [40, "c.pdf"]]
+    assert model.paths() == ["/d/d.pdf", "/d/cover.pdf", "/d/b.pdf", "/d/c.pdf"]
+
+
+def test_remove_rows_forgets_paths(model):
+    assert model.removeRows(1, 2)
+    assert model.paths() == ["/d/cover.pdf", "/d/d.pdf"]
+    assert not model.contains_path("/d/b.pdf")